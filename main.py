@@ -6,89 +6,134 @@ A modem-to-telnet bridge with configurable BBS menu and auto-login support.
 """
 
 import argparse
+import functools
 import logging
+import re
+import selectors
 import signal
-import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
+from typing import Optional
 
-import serial
-
-from modem_forwarder.bridge import bridge_session
-from modem_forwarder.config import load_config
-from modem_forwarder.logging_config import setup_logging
-from modem_forwarder.menu import display_menu, get_selection, display_external_menu, EXTERNAL_MENU
-from modem_forwarder.modem import flush_input_buffer, force_hangup, init_modem, wait_for_connect
-from modem_forwarder.syncterm import download_syncterm_list
-from modem_forwarder.terminal import get_terminal_type, safe_print
+from modem_forwarder import __version__
 
 logger = logging.getLogger(__name__)
 
-def _get_version():
-    """Get version from importlib.metadata, falling back to pyproject.toml."""
-    try:
-        from importlib.metadata import version as pkg_version
-        return pkg_version("modem-forwarder")
-    except Exception:
-        pass
-    try:
-        import re
-        pyproject = Path(__file__).parent / "pyproject.toml"
-        text = pyproject.read_text()
-        match = re.search(r'^version\s*=\s*"([^"]+)"', text, re.MULTILINE)
-        if match:
-            return match.group(1)
-    except Exception:
-        pass
-    return "unknown"
+# Delay bounds (seconds) between attempts to reopen the modem serial port
+SERIAL_RETRY_MIN = 1
+SERIAL_RETRY_MAX = 30
 
+# Current external BBS list; replaced wholesale when a background refresh completes
+_external_bbs_list = []
 
-__version__ = _get_version()
+_CONNECT_RATE_RE = re.compile(r"CONNECT\s+(\d+)", re.IGNORECASE)
 
 
+@functools.lru_cache(maxsize=1)
 def _get_git_branch():
-    """Return the current git branch name, or None if not in a git repo."""
+    """Return the current git branch name (or short commit if detached), or None if not in a git repo."""
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True, text=True, timeout=5,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except Exception:
-        pass
+        head = (Path(__file__).resolve().parent / ".git" / "HEAD").read_text().strip()
+    except OSError:
+        return None
+    if head.startswith("ref:"):
+        return head.split("/", 2)[-1]
+    return head[:7]
+
+
+def _parse_baud_rate(connect_string: str) -> Optional[str]:
+    """
+    Extract the line rate from a modem CONNECT string.
+
+    Args:
+        connect_string: CONNECT line from the modem (e.g. "CONNECT 2400/ARQ").
+
+    Returns:
+        The rate as a string (e.g. "2400"), or None if the modem did not report one.
+    """
+    match = _CONNECT_RATE_RE.search(connect_string)
+    if match:
+        return match.group(1)
+    logger.debug(f"No line rate in CONNECT string: {connect_string!r}")
     return None
 
 
-def menu_loop(ser, config, gc, external_bbs_list, term_type, local_mode=False):
+def _get_external_list():
+    """Return the current external BBS list."""
+    return _external_bbs_list
+
+
+def _refresh_external_list(gc) -> None:
     """
-    Display menu and handle selection in a loop.
+    Download the external BBS list and swap it in when complete.
+
+    Runs on a background thread so callers are served from the cached list
+    instead of waiting on the network.
 
-    Returns when the user chooses to disconnect or the session ends.
+    Args:
+        gc: Global configuration (external list URL and cache path).
     """
+    from modem_forwarder.syncterm import download_syncterm_list
+
+    global _external_bbs_list
+    try:
+        entries = download_syncterm_list(gc.external_bbs_url, gc.external_bbs_cache)
+    except Exception as e:
+        logger.error(f"External BBS list refresh failed: {e}")
+        return
+    if entries is None:
+        logger.info("External BBS list unchanged, keeping current list")
+    elif entries:
+        _external_bbs_list = entries
+        logger.info(f"Refreshed external BBS list: {len(entries)} entries")
+    else:
+        logger.warning("External BBS list refresh returned no entries, keeping current list")
+
+
+def _select_bbs(ser, config, gc, get_external_list, term_type):
+    """
+    Show the BBS menus until the user picks a BBS.
+
+    get_external_list is called on each pass so a background refresh of the
+    external BBS list shows up on the next menu render.
+
+    Returns:
+        Selected BBSEntry, or None if the user hung up or the menu timed out.
+    """
+    from modem_forwarder.menu import EXTERNAL_MENU, display_external_menu, display_menu, get_selection
+    from modem_forwarder.terminal import safe_print
+
+    bbs_entries = config.bbs_entries
+    welcome_message = gc.welcome_message
+    idle_timeout = gc.idle_timeout
+    debug = gc.debug_modem
+
     while True:
+        external_bbs_list = get_external_list()
+        external_count = len(external_bbs_list)
         display_menu(
             ser,
-            config.bbs_entries,
-            gc.welcome_message,
+            bbs_entries,
+            welcome_message,
             term_type,
-            external_count=len(external_bbs_list),
-            debug=gc.debug_modem,
+            external_count=external_count,
+            debug=debug,
         )
         selection = get_selection(
             ser,
-            config.bbs_entries,
+            bbs_entries,
             term_type,
-            has_external=len(external_bbs_list) > 0,
-            idle_timeout=gc.idle_timeout,
-            debug=gc.debug_modem,
+            has_external=external_count > 0,
+            idle_timeout=idle_timeout,
+            debug=debug,
         )
 
         if selection is None:
             # User chose to hang up / quit
-            safe_print(ser, "Goodbye!", term_type, debug=gc.debug_modem)
-            return
+            safe_print(ser, "Goodbye!", term_type, debug=debug)
+            return None
 
         if selection == EXTERNAL_MENU:
             # Show external BBS menu
@@ -96,25 +141,49 @@ def menu_loop(ser, config, gc, external_bbs_list, term_type, local_mode=False):
                 ser,
                 external_bbs_list,
                 term_type,
-                idle_timeout=gc.idle_timeout,
-                debug=gc.debug_modem,
+                idle_timeout=idle_timeout,
+                debug=debug,
             )
             if ext_selection is None:
                 # User chose to go back to main menu
                 continue
-            selected_bbs = ext_selection
-        else:
-            selected_bbs = selection
-
-        # Bridge to selected BBS
-        result = bridge_session(ser, selected_bbs, gc)
-        if result is False:
-            # Connection failed, return to menu
-            continue
-        if local_mode:
-            # In local mode, return to menu after session ends
-            continue
-        return
+            return ext_selection
+
+        return selection
+
+
+def _menu_loop_modem(ser, config, gc, get_external_list, term_type, sel):
+    """
+    Run the menu for a modem caller.
+
+    Returns after the first completed BBS session (the caller is then hung
+    up) or when the user chooses to disconnect. Failed connections return
+    to the menu.
+    """
+    from modem_forwarder.bridge import bridge_session
+
+    while True:
+        selected_bbs = _select_bbs(ser, config, gc, get_external_list, term_type)
+        if selected_bbs is None:
+            return
+        if bridge_session(ser, selected_bbs, gc, sel=sel) is not False:
+            return
+
+
+def _menu_loop_local(ser, config, gc, get_external_list, term_type, sel):
+    """
+    Run the menu for the local terminal.
+
+    Returns to the menu after every session; returns only when the user
+    chooses to quit.
+    """
+    from modem_forwarder.bridge import bridge_session
+
+    while True:
+        selected_bbs = _select_bbs(ser, config, gc, get_external_list, term_type)
+        if selected_bbs is None:
+            return
+        bridge_session(ser, selected_bbs, gc, sel=sel)
 
 
 def main_loop(config_path: str = "config.yaml", local_mode: bool = False, debug: bool = False) -> None:
@@ -126,6 +195,22 @@ def main_loop(config_path: str = "config.yaml", local_mode: bool = False, debug:
         local_mode: If True, use local terminal instead of modem.
         debug: If True, show log output on console.
     """
+    # Deferred so that `--help` does not pay for pyserial, PyYAML and urllib
+    import serial
+
+    from modem_forwarder.config import load_config
+    from modem_forwarder.logging_config import setup_logging
+    from modem_forwarder.modem import (
+        enable_low_latency,
+        flush_input_buffer,
+        force_hangup,
+        init_modem,
+        wait_for_connect,
+        wait_modem_idle,
+    )
+    from modem_forwarder.syncterm import load_syncterm_cache
+    from modem_forwarder.terminal import get_terminal_type
+
     # Handle SIGTERM (from systemd stop) the same as SIGINT
     def _handle_sigterm(signum, frame):
         raise KeyboardInterrupt
@@ -146,59 +231,76 @@ def main_loop(config_path: str = "config.yaml", local_mode: bool = False, debug:
     logger.info(f"Baud rate: {gc.default_baudrate}")
     logger.info(f"Loaded {len(config.bbs_entries)} BBS entries")
 
-    # Load external BBS list
-    external_bbs_list = download_syncterm_list(gc.external_bbs_url, gc.external_bbs_cache)
-    logger.info(f"Loaded {len(external_bbs_list)} external BBS entries")
+    # Serve the cached external BBS list now; refresh it in the background
+    global _external_bbs_list
+    _external_bbs_list = load_syncterm_cache(gc.external_bbs_cache)
+    logger.info(f"Loaded {len(_external_bbs_list)} external BBS entries from cache")
+    threading.Thread(
+        target=_refresh_external_list, args=(gc,), name="syncterm-refresh", daemon=True,
+    ).start()
+
+    # One selector serves every bridge session; each session registers
+    # and unregisters its own modem and socket
+    sel = selectors.DefaultSelector()
 
     if local_mode:
         from modem_forwarder.local_serial import LocalSerial
 
         logger.info("Starting in local mode (no modem)")
         try:
-            with LocalSerial() as ser:
+            with LocalSerial(timeout=gc.serial_timeout) as ser:
                 term_type = get_terminal_type(ser, debug=gc.debug_modem)
                 logger.info(f"Terminal type: {term_type.value}")
-                menu_loop(ser, config, gc, external_bbs_list, term_type, local_mode=True)
+                _menu_loop_local(ser, config, gc, _get_external_list, term_type, sel)
         except KeyboardInterrupt:
             logger.info("Modem Forwarder shutting down.")
         return
 
-    while True:
-        try:
-            with serial.Serial(
-                gc.modem_port,
-                gc.default_baudrate,
-                timeout=gc.serial_timeout,
-            ) as ser:
-                ser.dtr = True
-                ser.rtscts = False
-                ser.xonxoff = False
-
-                # Ensure clean state before init
-                force_hangup(ser, debug=gc.debug_modem)
-                init_modem(ser, init_sequence=gc.init_sequence, debug=gc.debug_modem)
-                flush_input_buffer(ser, debug=gc.debug_modem)
-
-                # Wait for incoming call
-                connect_string = wait_for_connect(ser, debug=gc.debug_modem)
-
-                # Detect or prompt for terminal type
-                term_type = get_terminal_type(ser, debug=gc.debug_modem)
-                logger.info(f"Terminal type: {term_type.value}")
-
-                # Show menu and handle selection
-                menu_loop(ser, config, gc, external_bbs_list, term_type)
-
-                # Post-session cleanup
-                force_hangup(ser, debug=gc.debug_modem)
-                time.sleep(1)
-
-        except serial.SerialException as e:
-            logger.error(f"Serial error: {e}")
-            time.sleep(5)
-        except KeyboardInterrupt:
-            logger.info("Modem Forwarder shutting down.")
-            sys.exit(0)
+    retry_delay = SERIAL_RETRY_MIN
+    try:
+        while True:
+            try:
+                with serial.Serial(
+                    gc.modem_port,
+                    gc.default_baudrate,
+                    timeout=gc.serial_timeout,
+                    rtscts=False,
+                    xonxoff=False,
+                    dsrdtr=False,
+                ) as ser:
+                    retry_delay = SERIAL_RETRY_MIN
+                    # DTR is asserted by pyserial during open()
+                    enable_low_latency(ser, debug=gc.debug_modem)
+
+                    # Ensure clean state before init
+                    force_hangup(ser, debug=gc.debug_modem)
+                    init_modem(ser, init_sequence=gc.init_sequence, debug=gc.debug_modem)
+                    flush_input_buffer(ser, debug=gc.debug_modem)
+
+                    # Wait for incoming call
+                    connect_string = wait_for_connect(ser, debug=gc.debug_modem)
+                    logger.info(f"Caller connected at {_parse_baud_rate(connect_string) or 'unknown'} bps")
+
+                    # Detect or prompt for terminal type
+                    term_type = get_terminal_type(ser, debug=gc.debug_modem)
+                    logger.info(f"Terminal type: {term_type.value}")
+
+                    # Show menu and handle selection
+                    _menu_loop_modem(ser, config, gc, _get_external_list, term_type, sel)
+
+                    # Post-session cleanup
+                    force_hangup(ser, debug=gc.debug_modem)
+                    wait_modem_idle(ser, timeout=1.0, debug=gc.debug_modem)
+
+            except serial.SerialException as e:
+                logger.error(f"Serial error: {e} (retrying in {retry_delay}s)")
+                # Back off exponentially while the port stays unavailable;
+                # a signal interrupts the sleep immediately
+                time.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, SERIAL_RETRY_MAX)
+    except KeyboardInterrupt:
+        logger.info("Modem Forwarder shutting down.")
+        sys.exit(0)
 
 
 def cli():
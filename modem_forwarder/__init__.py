@@ -1,3 +1,27 @@
 """Modem Forwarder - Multi-BBS Menu System."""
 
-__version__ = "2.2.0"
+import re
+from pathlib import Path
+
+_VERSION_RE = re.compile(r'^version\s*=\s*"([^"]+)"', re.MULTILINE)
+
+
+def _get_version():
+    """Get version from importlib.metadata, falling back to pyproject.toml."""
+    try:
+        from importlib.metadata import version as pkg_version
+        return pkg_version("modem-forwarder")
+    except Exception:
+        pass
+    try:
+        pyproject = Path(__file__).parent.parent / "pyproject.toml"
+        text = pyproject.read_text()
+        match = _VERSION_RE.search(text)
+        if match:
+            return match.group(1)
+    except Exception:
+        pass
+    return "unknown"
+
+
+__version__ = _get_version()
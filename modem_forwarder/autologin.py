@@ -1,6 +1,7 @@
 """Auto-login macro execution."""
 
 import logging
+import socket
 import time
 from typing import List
 
@@ -10,6 +11,111 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_WAIT_TIMEOUT = 30.0  # seconds
 
+# Trim the wait buffer once it grows past this many bytes...
+WAIT_BUFFER_MAX = 64 * 1024
+# ...keeping this much beyond the target length
+WAIT_BUFFER_KEEP = 1024
+
+
+def _unicode_lower(data: bytes) -> bytes:
+    """Lower-case received bytes as text, for targets bytes.lower() can't fold."""
+    return data.decode(errors="ignore").lower().encode()
+
+
+def _step_wait(sock, step: AutoLoginStep, timeout: float) -> bool:
+    """
+    Read from the socket until step.value appears (case-insensitive).
+
+    Each recv blocks for at most the time left, so the target is seen as
+    soon as it arrives and the timeout is honoured even on a silent socket.
+    Received bytes are lower-cased once as they arrive and kept undecoded;
+    only the new bytes, plus enough overlap for a target split across
+    reads, are searched on each recv. A non-ASCII target needs Unicode
+    case folding, so for those each chunk is decoded, lowered and
+    re-encoded instead.
+
+    Args:
+        sock: Connected socket.
+        step: The wait step; its value is the target string.
+        timeout: Seconds to wait for the target.
+
+    Returns:
+        True if the target was seen, False on timeout/error.
+    """
+    deadline = time.monotonic() + timeout
+    target = step.value.lower().encode()
+    fold = bytes.lower if step.value.isascii() else _unicode_lower
+    buffer = bytearray()
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.warning(f"Timeout waiting for: {step.value!r}")
+            return False
+        try:
+            # Block in recv until data arrives or the wait runs out
+            sock.settimeout(remaining)
+            data = sock.recv(1024)
+            if not data:
+                logger.warning("Connection closed during auto-login")
+                return False
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Received: {data.decode(errors='ignore')!r}")
+        except (socket.timeout, BlockingIOError):
+            continue
+        except Exception as e:
+            logger.error(f"Error during auto-login wait: {e}")
+            return False
+
+        scan_from = max(0, len(buffer) - len(target) + 1)
+        buffer += fold(data)
+        if buffer.find(target, scan_from) >= 0:
+            logger.debug(f"Found target string: {step.value!r}")
+            return True
+        if len(buffer) > WAIT_BUFFER_MAX:
+            del buffer[:-(len(target) + WAIT_BUFFER_KEEP)]
+
+
+def _step_send(sock, step: AutoLoginStep, timeout: float) -> bool:
+    """Send step.value followed by a carriage return."""
+    text = step.value + "\r"
+    logger.debug(f"Sending: {text!r}")
+    try:
+        sock.sendall(text.encode())
+    except Exception as e:
+        logger.error(f"Error during auto-login send: {e}")
+        return False
+    return True
+
+
+def _step_send_raw(sock, step: AutoLoginStep, timeout: float) -> bool:
+    """Send step.value exactly as given."""
+    logger.debug(f"Sending raw: {step.value!r}")
+    try:
+        sock.sendall(step.value.encode())
+    except Exception as e:
+        logger.error(f"Error during auto-login send_raw: {e}")
+        return False
+    return True
+
+
+def _step_delay(sock, step: AutoLoginStep, timeout: float) -> bool:
+    """Pause for step.value milliseconds."""
+    delay_ms = step.value
+    delay_sec = delay_ms / 1000.0
+    logger.debug(f"Delaying {delay_ms}ms")
+    time.sleep(delay_sec)
+    return True
+
+
+# Auto-login action name -> handler(sock, step, timeout) -> success
+_STEP_HANDLERS = {
+    "wait": _step_wait,
+    "send": _step_send,
+    "send_raw": _step_send_raw,
+    "delay": _step_delay,
+}
+
 
 def execute_autologin(
     sock,
@@ -28,62 +134,16 @@ def execute_autologin(
         True if all steps completed, False on timeout/error.
     """
     logger.info(f"Executing auto-login sequence with {len(steps)} steps")
-    buffer = ""
 
     for i, step in enumerate(steps):
         logger.debug(f"Auto-login step {i + 1}: {step.action} = {step.value!r}")
 
-        if step.action == "wait":
-            # Accumulate data until we see the target string
-            deadline = time.time() + timeout
-            target = step.value.lower()
-
-            while target not in buffer.lower():
-                if time.time() > deadline:
-                    logger.warning(f"Timeout waiting for: {step.value!r}")
-                    return False
-                try:
-                    data = sock.recv(1024)
-                    if not data:
-                        logger.warning("Connection closed during auto-login")
-                        return False
-                    decoded = data.decode(errors='ignore')
-                    buffer += decoded
-                    logger.debug(f"Received: {decoded!r}")
-                except BlockingIOError:
-                    time.sleep(0.05)
-                except Exception as e:
-                    logger.error(f"Error during auto-login wait: {e}")
-                    return False
-
-            logger.debug(f"Found target string: {step.value!r}")
-            buffer = ""  # Clear buffer after match
-
-        elif step.action == "send":
-            text = step.value + "\r"
-            logger.debug(f"Sending: {text!r}")
-            try:
-                sock.sendall(text.encode())
-            except Exception as e:
-                logger.error(f"Error during auto-login send: {e}")
-                return False
-
-        elif step.action == "send_raw":
-            logger.debug(f"Sending raw: {step.value!r}")
-            try:
-                sock.sendall(step.value.encode())
-            except Exception as e:
-                logger.error(f"Error during auto-login send_raw: {e}")
-                return False
-
-        elif step.action == "delay":
-            delay_ms = step.value
-            delay_sec = delay_ms / 1000.0
-            logger.debug(f"Delaying {delay_ms}ms")
-            time.sleep(delay_sec)
-
-        else:
+        handler = _STEP_HANDLERS.get(step.action)
+        if handler is None:
             logger.warning(f"Unknown auto-login action: {step.action}")
+            continue
+        if not handler(sock, step, timeout):
+            return False
 
     logger.info("Auto-login sequence completed successfully")
     return True
@@ -1,23 +1,141 @@
 """Bridge session handling for telnet, SSH, and rlogin."""
 
 import logging
+import os
 import selectors
 import time
+from typing import Optional
 
 import serial
 
 from .autologin import execute_autologin
 from .config import BBSEntry, GlobalConfig
-from .modem import force_hangup, modem_print
+from .modem import force_hangup, modem_print, take_typeahead
 from .protocols import create_connection
 
 logger = logging.getLogger(__name__)
 
+# Bytes requested per os.read() on the modem fd in the bridge loop
+MODEM_FD_READ_SIZE = 4096
+
+# BBS->modem output is held until this many bytes are buffered...
+COALESCE_MAX_BYTES = 64
+# ...or this many seconds have passed since the first buffered byte
+COALESCE_DELAY = 0.02
+
+# Minimum seconds between carrier detect (TIOCMGET) checks in the bridge loop
+CD_CHECK_INTERVAL = 0.25
+
+
+class ModemWriteCoalescer:
+    """
+    Coalesce small BBS->modem writes into fewer, larger serial writes.
+
+    Data is buffered until COALESCE_MAX_BYTES have accumulated or
+    COALESCE_DELAY has elapsed since the first buffered byte. A chunk that
+    is already large enough is written straight through without copying.
+
+    Writes are not followed by ser.flush(): pyserial's flush() waits in
+    tcdrain() until every queued byte has left the UART, which at 2400 bps
+    would stall the bridge loop for seconds per chunk. The tty driver
+    transmits queued output on its own.
+    """
+
+    def __init__(self, ser: serial.Serial, max_bytes: int = COALESCE_MAX_BYTES, delay: float = COALESCE_DELAY, debug: bool = False):
+        self.ser = ser
+        self.max_bytes = max_bytes
+        self.delay = delay
+        self.debug = debug
+        self.deadline: Optional[float] = None
+        self._buf = bytearray()
+
+    def append(self, data: bytes) -> None:
+        """Queue data for the modem, flushing if the size threshold is reached."""
+        if not self._buf:
+            if len(data) >= self.max_bytes:
+                self._write(data)
+                return
+            self.deadline = time.monotonic() + self.delay
+        self._buf += data
+        if len(self._buf) >= self.max_bytes:
+            self.flush()
+
+    def timeout(self, default: Optional[float], now: Optional[float] = None) -> Optional[float]:
+        """Return how long the caller may block (None = forever) before the next flush is due."""
+        if self.deadline is None:
+            return default
+        if now is None:
+            now = time.monotonic()
+        remaining = max(0.0, self.deadline - now)
+        return remaining if default is None else min(default, remaining)
+
+    def flush_if_due(self, now: Optional[float] = None) -> None:
+        """Flush the buffer if its delay has expired."""
+        if self.deadline is None:
+            return
+        if now is None:
+            now = time.monotonic()
+        if now >= self.deadline:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered data to the modem."""
+        if not self._buf:
+            return
+        self._write(bytes(self._buf))
+        self._buf.clear()
+        self.deadline = None
+
+    def _write(self, data: bytes) -> None:
+        """Queue data on the serial port without waiting for it to drain."""
+        if self.debug:
+            logger.debug(f"Writing {len(data)} coalesced bytes to modem")
+        self.ser.write(data)
+
+
+def _modem_reader(ser: serial.Serial, read_chunk: int):
+    """
+    Return a zero-argument callable that reads available modem data.
+
+    For a real serial port this reads the file descriptor directly with
+    os.read(), skipping pyserial's per-call Python overhead. LocalSerial
+    (stdin/stdout) keeps using its own read(). Only call the reader after
+    the selector reports the modem readable: like pyserial, a readable fd
+    that returns no data is treated as a disconnected device (EOFError).
+
+    Args:
+        ser: Serial port object.
+        read_chunk: Bytes requested per read in local mode.
+
+    Returns:
+        Callable returning the bytes read.
+    """
+    if getattr(ser, 'is_local', False):
+        # One fixed-size read drains what's buffered without an in_waiting
+        # probe. Ask for at least LocalSerial's own fill size so nothing is
+        # left in its buffer, where the selector can't see it.
+        size = max(read_chunk, getattr(ser, 'READ_SIZE', read_chunk))
+        return lambda: ser.read(size)
+
+    fd = ser.fileno()
+
+    def _read():
+        try:
+            data = os.read(fd, MODEM_FD_READ_SIZE)
+        except BlockingIOError:
+            return b""
+        if not data:
+            raise EOFError("serial device reported readiness but returned no data")
+        return data
+
+    return _read
+
 
 def bridge_session(
     ser: serial.Serial,
     bbs: BBSEntry,
     config: GlobalConfig,
+    sel: Optional[selectors.BaseSelector] = None,
 ) -> None:
     """
     Bridge modem to BBS via telnet, SSH, or rlogin.
@@ -26,6 +144,9 @@ def bridge_session(
         ser: Serial port object.
         bbs: BBS configuration (host, port, protocol, auto_login, etc.).
         config: Global settings (chunk sizes, debug flag).
+        sel: Long-lived selector to register the session on. The session
+            unregisters its files on exit but leaves the selector open.
+            If None, a selector is created and closed for this session.
     """
     protocol = getattr(bbs, 'protocol', 'telnet')
     logger.info(f"Connecting to {bbs.name} at {bbs.host}:{bbs.port} via {protocol}...")
@@ -49,43 +170,96 @@ def bridge_session(
     else:
         logger.debug("No auto-login configured, skipping")
 
+    # Keys typed ahead at a prompt belong to the BBS
+    typeahead = take_typeahead(ser)
+    if getattr(ser, 'is_local', False):
+        # Left in LocalSerial's buffer by the last prompt, where the
+        # selector would never see them
+        typeahead += ser.read_buffered()
+    if typeahead:
+        logger.debug(f"Forwarding {len(typeahead)} typeahead bytes to BBS")
+        try:
+            sock.sendall(typeahead)
+        except Exception as e:
+            logger.error(f"Write to BBS failed: {e}")
+
     sock.setblocking(False)
-    sel = selectors.DefaultSelector()
-    sel.register(ser, selectors.EVENT_READ, data="modem")
-    sel.register(sock, selectors.EVENT_READ, data="bbs")
+    owns_selector = sel is None
+    if owns_selector:
+        sel = selectors.DefaultSelector()
 
+    # Decide once whether per-chunk tracing is wanted, so the hot loop
+    # never formats debug output that would be discarded
+    trace = config.debug_modem and logger.isEnabledFor(logging.DEBUG)
+    read_modem = _modem_reader(ser, config.modem_read_chunk)
+    modem_out = ModemWriteCoalescer(ser, debug=trace)
     idle_timeout = config.idle_timeout
     logger.info(f"Connection established. Entering bridge loop... (idle timeout: {idle_timeout}s)")
 
-    last_activity = time.time()
+    check_carrier = not getattr(ser, 'is_local', False)
+    last_cd_check = 0.0
+    # Set when a carrier check was skipped by the throttle; the next
+    # select then wakes up in time to make it even if the line goes quiet
+    cd_check_pending = False
+    last_activity = time.monotonic()
     try:
+        modem_key = sel.register(ser, selectors.EVENT_READ)
+        sel.register(sock, selectors.EVENT_READ)
         while True:
-            events = sel.select(1)
+            # Sleep until traffic arrives, a coalesced write is due, or the
+            # session would go idle - no periodic wakeups
+            now = time.monotonic()
+            if idle_timeout:
+                idle_remaining = max(0.0, idle_timeout - (now - last_activity))
+            else:
+                idle_remaining = None
+            timeout = modem_out.timeout(idle_remaining, now)
+            if cd_check_pending:
+                cd_remaining = max(0.0, CD_CHECK_INTERVAL - (now - last_cd_check))
+                timeout = cd_remaining if timeout is None else min(timeout, cd_remaining)
+            events = sel.select(timeout)
+            # One clock read serves the rest of this iteration
+            now = time.monotonic()
+            try:
+                modem_out.flush_if_due(now)
+            except Exception as e:
+                logger.error(f"Write to modem failed: {e}")
+                return
+
+            # Check for carrier loss (caller hung up), at most every
+            # CD_CHECK_INTERVAL rather than with an ioctl per event
+            if check_carrier and (events or cd_check_pending):
+                if now - last_cd_check >= CD_CHECK_INTERVAL:
+                    last_cd_check = now
+                    cd_check_pending = False
+                    if not ser.cd:
+                        logger.info("Carrier lost (caller disconnected). Ending session.")
+                        return
+                else:
+                    cd_check_pending = True
+
             if not events:
-                if idle_timeout and time.time() - last_activity > idle_timeout:
+                if idle_timeout and now - last_activity >= idle_timeout:
                     logger.warning(f"Session timed out after {idle_timeout}s of inactivity")
                     modem_print(ser, "\r\nSession timed out due to inactivity.", debug=config.debug_modem)
                     return
                 continue
 
-            # Check for carrier loss (caller hung up)
-            if not getattr(ser, 'is_local', False) and not ser.cd:
-                logger.info("Carrier lost (caller disconnected). Ending session.")
-                return
-
-            for key, mask in events:
-                source = key.data
-
-                if source == "modem":
+            # Only two files are registered: dispatch on key identity
+            for key, _mask in events:
+                if key is modem_key:
                     try:
-                        data = ser.read(ser.in_waiting or config.modem_read_chunk)
+                        data = read_modem()
+                    except EOFError:
+                        logger.info("Serial device closed (modem disconnected). Ending session.")
+                        return
                     except Exception as e:
                         logger.error(f"Error reading modem: {e}")
                         data = b""
 
                     if data:
-                        last_activity = time.time()
-                        if config.debug_modem:
+                        last_activity = now
+                        if trace:
                             logger.debug(f"Modem->Telnet: {len(data)} bytes: {data[:80]!r}")
                         try:
                             sock.sendall(data)
@@ -93,7 +267,7 @@ def bridge_session(
                             logger.error(f"Send to BBS failed: {e}")
                             return
 
-                elif source == "bbs":
+                else:
                     try:
                         data = sock.recv(config.bbs_read_chunk)
                     except BlockingIOError:
@@ -103,12 +277,11 @@ def bridge_session(
                         data = b""
 
                     if data:
-                        last_activity = time.time()
-                        if config.debug_modem:
+                        last_activity = now
+                        if trace:
                             logger.debug(f"Telnet->Modem: {len(data)} bytes: {data[:80]!r}")
                         try:
-                            ser.write(data)
-                            ser.flush()
+                            modem_out.append(data)
                         except Exception as e:
                             logger.error(f"Write to modem failed: {e}")
                             return
@@ -119,10 +292,18 @@ def bridge_session(
 
     finally:
         try:
-            sel.unregister(ser)
-            sel.unregister(sock)
-        except Exception:
-            pass
+            # Let pending BBS output reach the caller before hanging up
+            modem_out.flush()
+            ser.flush()
+        except Exception as e:
+            logger.error(f"Write to modem failed: {e}")
+        for fileobj in (ser, sock):
+            try:
+                sel.unregister(fileobj)
+            except Exception:
+                pass
+        if owns_selector:
+            sel.close()
         sock.close()
         logger.info("Bridge loop exited, forcing hangup.")
         force_hangup(ser, debug=config.debug_modem)
@@ -1,40 +1,91 @@
 """Configuration loading and dataclasses for Modem Forwarder."""
 
+import json
 import logging
+import os
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+# Prefer the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# Resolved config path -> (st_mtime_ns, st_size, Config) from the last load
+_CONFIG_CACHE: Dict[str, Tuple[int, int, "Config"]] = {}
+
+# Width of the BBS name column in paginated menu listings
+DISPLAY_NAME_COLS = 30
+
+# Protocol used when a BBS entry doesn't name one
+DEFAULT_PROTOCOL = "telnet"
+
+# Suffix of the JSON copy of the parsed YAML written next to the config file
+JSON_CACHE_SUFFIX = ".jsoncache"
 
-@dataclass
+
+@dataclass(frozen=True)
 class AutoLoginStep:
     """Single step in an auto-login sequence."""
     action: str  # 'wait', 'send', 'send_raw', 'delay'
     value: Any   # string for wait/send/send_raw, int for delay (ms)
 
 
-@dataclass
+@dataclass(frozen=True)
 class BBSEntry:
-    """Configuration for a single BBS."""
+    """
+    Configuration for a single BBS.
+
+    The auto-login steps are kept as raw YAML data (auto_login_raw) and
+    only turned into AutoLoginStep objects when auto_login is first read,
+    i.e. when the entry is actually dialled.
+
+    Entries are frozen: they are shared between the menus, the search
+    cache and the config cache, so nothing may change one in place.
+    """
     name: str
     host: str
     port: int
     description: str = ""
-    protocol: str = "telnet"  # "telnet", "ssh", "rlogin"
-    auto_login: Optional[List[AutoLoginStep]] = None
-
-
-@dataclass
+    protocol: str = DEFAULT_PROTOCOL  # "telnet", "ssh", "rlogin"
+    auto_login_raw: Optional[List[dict]] = field(default=None, repr=False)
+    # Name truncated/padded to the external menu column plus protocol tag
+    display_row: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute the menu row so page renders don't re-slice and pad every name."""
+        object.__setattr__(
+            self, "display_row",
+            f"{self.name[:DISPLAY_NAME_COLS]:<{DISPLAY_NAME_COLS}} [{self.protocol}]",
+        )
+
+    @cached_property
+    def search_text(self) -> str:
+        """Lower-cased name and description, NUL-separated, for case-insensitive search."""
+        if not self.description:
+            return self.name.lower()
+        return f"{self.name.lower()}\0{self.description.lower()}"
+
+    @cached_property
+    def auto_login(self) -> Optional[List[AutoLoginStep]]:
+        """Auto-login steps, parsed from auto_login_raw on first access."""
+        return _parse_auto_login(self.auto_login_raw)
+
+
+@dataclass(frozen=True)
 class GlobalConfig:
     """Global configuration settings."""
     modem_port: str = "/dev/ttyUSB0"
     default_baudrate: int = 115200
-    serial_timeout: float = 0
-    modem_read_chunk: int = 1
+    serial_timeout: float = 0.1
+    modem_read_chunk: int = 256
     bbs_read_chunk: int = 1024
     hangup_read_timeout: float = 0.5
     debug_modem: bool = False
@@ -49,7 +100,7 @@ class GlobalConfig:
     external_bbs_cache: str = "syncterm_cache.lst"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     """Complete configuration."""
     global_config: GlobalConfig
@@ -71,13 +122,14 @@ def _parse_auto_login(steps_data: Optional[List[dict]]) -> Optional[List[AutoLog
 
 def _parse_bbs_entry(data: dict) -> BBSEntry:
     """Parse a single BBS entry from YAML data."""
+    get = data.get
     return BBSEntry(
         name=data["name"],
         host=data["host"],
         port=data["port"],
-        description=data.get("description", ""),
-        protocol=data.get("protocol", "telnet"),
-        auto_login=_parse_auto_login(data.get("auto_login")),
+        description=get("description", ""),
+        protocol=get("protocol", DEFAULT_PROTOCOL),
+        auto_login_raw=get("auto_login"),
     )
 
 
@@ -86,8 +138,8 @@ def _parse_global_config(data: dict) -> GlobalConfig:
     return GlobalConfig(
         modem_port=data.get("modem_port", "/dev/ttyUSB0"),
         default_baudrate=data.get("default_baudrate", 9600),
-        serial_timeout=data.get("serial_timeout", 0),
-        modem_read_chunk=data.get("modem_read_chunk", 1),
+        serial_timeout=data.get("serial_timeout", 0.1),
+        modem_read_chunk=data.get("modem_read_chunk", 256),
         bbs_read_chunk=data.get("bbs_read_chunk", 1024),
         hangup_read_timeout=data.get("hangup_read_timeout", 0.5),
         debug_modem=data.get("debug_modem", False),
@@ -101,10 +153,63 @@ def _parse_global_config(data: dict) -> GlobalConfig:
     )
 
 
+def _read_json_cache(cache_path: Path, st: os.stat_result) -> Optional[dict]:
+    """
+    Return the raw config data from the JSON sidecar if it matches the YAML file.
+
+    Args:
+        cache_path: Path to the JSON sidecar.
+        st: stat() result of the YAML config file.
+
+    Returns:
+        The parsed data, or None if the sidecar is missing, stale or unreadable.
+    """
+    try:
+        cached = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("mtime_ns") != st.st_mtime_ns or cached.get("size") != st.st_size:
+        return None
+    logger.debug(f"Using parsed config from {cache_path}")
+    return cached.get("data")
+
+
+def _write_json_cache(cache_path: Path, st: os.stat_result, data: dict) -> None:
+    """
+    Write the raw config data to the JSON sidecar, stamped with the YAML file's mtime and size.
+
+    Failures (read-only directory, YAML values JSON can't represent) are
+    logged and ignored; the next start simply parses the YAML again.
+
+    The sidecar holds the same secrets as the YAML (auto-login passwords),
+    so it is created readable by the owner only.
+
+    Args:
+        cache_path: Path to the JSON sidecar.
+        st: stat() result of the YAML config file.
+        data: Parsed YAML data.
+    """
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        payload = json.dumps({"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data})
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "w") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+
+
 def load_config(config_path: str = "config.yaml") -> Config:
     """
     Load configuration from a YAML file.
 
+    The parsed Config is cached and returned as-is while the file's
+    mtime and size are unchanged, so callers must treat it as read-only.
+    The parsed YAML is also saved as JSON next to the config file
+    (config.yaml.jsoncache), which later starts load instead of
+    re-parsing the YAML while the file is unchanged.
+
     Args:
         config_path: Path to the YAML config file.
 
@@ -116,18 +221,31 @@ def load_config(config_path: str = "config.yaml") -> Config:
         yaml.YAMLError: If config file is invalid YAML.
     """
     path = Path(config_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
-
-    with open(path, "r") as f:
-        data = yaml.safe_load(f)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+    cache_key = str(path.resolve())
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        logger.debug(f"Using cached config for {config_path}")
+        return cached[2]
+
+    json_cache = path.with_name(path.name + JSON_CACHE_SUFFIX)
+    data = _read_json_cache(json_cache, st)
+    if data is None:
+        # libyaml reads bytes directly, no separate decode pass needed
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+        _write_json_cache(json_cache, st, data)
 
     global_config = _parse_global_config(data.get("global", {}))
 
-    bbs_entries = []
-    for entry_data in data.get("bbs_entries", []):
-        bbs_entries.append(_parse_bbs_entry(entry_data))
+    bbs_entries = [_parse_bbs_entry(entry_data) for entry_data in data.get("bbs_entries", ())]
 
-    logger.info(f"Loaded config with {len(bbs_entries)} BBS entries")
+    logger.info("Loaded config with %d BBS entries", len(bbs_entries))
 
-    return Config(global_config=global_config, bbs_entries=bbs_entries)
+    config = Config(global_config=global_config, bbs_entries=bbs_entries)
+    _CONFIG_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, config)
+    return config
@@ -1,10 +1,11 @@
 """Local serial port emulation using stdin/stdout for testing without a modem."""
 
 import os
-import select
+import selectors
 import sys
 import termios
 import tty
+from typing import Optional
 
 
 class LocalSerial:
@@ -12,20 +13,29 @@ class LocalSerial:
 
     is_local = True
 
-    def __init__(self):
+    # Bytes pulled from stdin per os.read(); reads are served from the buffer
+    READ_SIZE = 4096
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout
         self._stdin_fd = sys.stdin.fileno()
         self._stdout_fd = sys.stdout.fileno()
         self._old_settings = termios.tcgetattr(self._stdin_fd)
         tty.setraw(self._stdin_fd)
         self._closed = False
+        self._rbuf = bytearray()
+        # Registered once; readiness checks reuse it instead of rebuilding fd sets
+        self._poller = selectors.DefaultSelector()
+        self._poller.register(self._stdin_fd, selectors.EVENT_READ)
 
     # --- Properties expected by modem.py ---
 
     @property
     def in_waiting(self) -> int:
-        """Return number of bytes available to read (0 or 1)."""
-        r, _, _ = select.select([self._stdin_fd], [], [], 0)
-        return 1 if r else 0
+        """Return number of buffered bytes, or 1 if stdin is readable (0 if neither)."""
+        if self._rbuf:
+            return len(self._rbuf)
+        return 1 if self._poller.select(0) else 0
 
     @property
     def dtr(self) -> bool:
@@ -50,15 +60,29 @@ class LocalSerial:
         return os.write(self._stdout_fd, data)
 
     def read(self, size: int = 1) -> bytes:
-        """Read bytes from stdin."""
-        return os.read(self._stdin_fd, size)
+        """
+        Read up to size bytes, waiting at most `timeout` seconds (None = forever).
+
+        Bytes are taken from stdin READ_SIZE at a time and handed out from an
+        internal buffer, so a burst of typed or pasted input costs one syscall.
+        """
+        if not self._rbuf:
+            if self.timeout is not None and not self._poller.select(self.timeout):
+                return b""
+            self._rbuf += os.read(self._stdin_fd, max(size, self.READ_SIZE))
+        data = bytes(self._rbuf[:size])
+        del self._rbuf[:size]
+        return data
+
+    def read_buffered(self) -> bytes:
+        """Remove and return bytes already taken from stdin but not yet read."""
+        data = bytes(self._rbuf)
+        self._rbuf.clear()
+        return data
 
     def flush(self) -> None:
-        """Flush stdout."""
-        try:
-            os.fsync(self._stdout_fd)
-        except OSError:
-            pass
+        """No-op: write() goes straight to the stdout fd, nothing is buffered."""
+        pass
 
     def fileno(self) -> int:
         """Return stdin file descriptor for use with selectors."""
@@ -67,10 +91,10 @@ class LocalSerial:
     # --- No-ops for modem-specific operations ---
 
     def reset_input_buffer(self) -> None:
-        pass
+        self._rbuf.clear()
 
     def flushInput(self) -> None:
-        pass
+        self._rbuf.clear()
 
     # --- Context manager ---
 
@@ -78,6 +102,7 @@ class LocalSerial:
         """Restore terminal settings."""
         if not self._closed:
             termios.tcsetattr(self._stdin_fd, termios.TCSADRAIN, self._old_settings)
+            self._poller.close()
             self._closed = True
 
     def __enter__(self):
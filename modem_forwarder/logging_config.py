@@ -5,10 +5,21 @@ import logging.handlers
 import sys
 
 
+# Formatters shared by every setup_logging() call
+_FORMATTER = logging.Formatter(
+    "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+_SYSLOG_FORMATTER = logging.Formatter("modem-forwarder[%(process)d]: %(message)s")
+
+
 def setup_logging(log_target: str = "syslog", level: str = "INFO", console: bool = False) -> None:
     """
     Configure logging to syslog or file, and optionally console.
 
+    Any handlers already on the root logger are closed and replaced, so
+    calling this again is safe.
+
     Args:
         log_target: "syslog" for system syslog, or a file path for file logging.
         level: Log level (DEBUG, INFO, WARNING, ERROR).
@@ -16,34 +27,22 @@ def setup_logging(log_target: str = "syslog", level: str = "INFO", console: bool
     """
     log_level = getattr(logging, level.upper(), logging.INFO)
 
-    formatter = logging.Formatter(
-        "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
-    root_logger = logging.getLogger()
-    root_logger.setLevel(log_level)
-    root_logger.handlers.clear()
-
     if log_target == "syslog":
-        syslog_handler = logging.handlers.SysLogHandler(
+        target_handler = logging.handlers.SysLogHandler(
             address="/dev/log",
             facility=logging.handlers.SysLogHandler.LOG_DAEMON,
         )
-        syslog_formatter = logging.Formatter("modem-forwarder[%(process)d]: %(message)s")
-        syslog_handler.setLevel(log_level)
-        syslog_handler.setFormatter(syslog_formatter)
-        root_logger.addHandler(syslog_handler)
+        target_handler.setFormatter(_SYSLOG_FORMATTER)
     else:
-        file_handler = logging.FileHandler(log_target)
-        file_handler.setLevel(log_level)
-        file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        target_handler = logging.FileHandler(log_target)
+        target_handler.setFormatter(_FORMATTER)
+    handlers = [target_handler]
 
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(log_level)
-        console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        console_handler.setFormatter(_FORMATTER)
+        handlers.append(console_handler)
+
+    logging.basicConfig(level=log_level, handlers=handlers, force=True)
 
-    logging.info(f"Logging initialized: level={level}, target={log_target}")
+    logging.info("Logging initialized: level=%s, target=%s", level, log_target)
@@ -1,19 +1,93 @@
 """Menu display and selection system."""
 
+import functools
 import logging
-from typing import List, Optional, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 import serial
 
 from .config import BBSEntry
-from .modem import modem_getch, modem_input
-from .terminal import TerminalType, safe_print, color_print, Color
+from .modem import BufferedModemWriter, modem_getch, modem_input
+from .terminal import TerminalType, safe_print, color_print, render_line, Color
 
 logger = logging.getLogger(__name__)
 
 # Special return value indicating user wants external BBS menu
 EXTERNAL_MENU = "external"
 
+# Single-keystroke parsing on raw bytes: ASCII digits, and a mask that
+# folds lower-case letters to upper case
+_DIGIT_0 = ord("0")
+_DIGIT_9 = ord("9")
+_UPPER_MASK = 0xDF
+
+# External menu navigation keys (upper case) -> command
+_NAV_KEYS = {
+    ord("N"): "next",
+    ord("P"): "prev",
+    ord("S"): "search",
+    ord("C"): "clear",
+}
+
+# Entry list the external menu rows were built from (held so its id can't
+# be reused) and the matching display_row strings
+_rows_source: Optional[List[BBSEntry]] = None
+_rows: Tuple[str, ...] = ()
+
+
+@functools.lru_cache(maxsize=16)
+def _menu_prelude(welcome_message: str, term_type: TerminalType) -> bytes:
+    """Return the fixed menu header (welcome banner and title); computed once per terminal type."""
+    blank = render_line("", term_type)
+    return b"".join((
+        blank,
+        render_line(welcome_message, term_type, Color.CYAN),
+        blank,
+        render_line("=== BBS Directory ===", term_type, Color.YELLOW),
+        blank,
+    ))
+
+
+@functools.lru_cache(maxsize=16)
+def _menu_epilogue(external_count: int, term_type: TerminalType) -> bytes:
+    """Return the fixed menu footer (external and hang-up options)."""
+    blank = render_line("", term_type)
+    lines = [blank]
+    if external_count > 0:
+        lines.append(render_line(f"X. External BBSes ({external_count}+)", term_type, Color.CYAN))
+    lines.append(render_line("0. Hang up", term_type, Color.RED))
+    lines.append(blank)
+    return b"".join(lines)
+
+
+def render_menu(
+    bbs_entries: List[BBSEntry],
+    welcome_message: str,
+    term_type: TerminalType,
+    external_count: int = 0,
+) -> bytes:
+    """
+    Render the whole BBS selection menu as the bytes to send to the modem.
+
+    Args:
+        bbs_entries: List of available BBS entries.
+        welcome_message: Welcome message to display.
+        term_type: Terminal type for charset-safe output.
+        external_count: Number of external BBSes available.
+
+    Returns:
+        The complete menu, encoded for the terminal type.
+    """
+    lines = [_menu_prelude(welcome_message, term_type)]
+
+    for i, bbs in enumerate(bbs_entries, start=1):
+        lines.append(render_line(f"{i}. {bbs.name}", term_type, Color.GREEN))
+        if bbs.description:
+            lines.append(render_line(f"   {bbs.description}", term_type, Color.WHITE))
+
+    lines.append(_menu_epilogue(external_count, term_type))
+    return b"".join(lines)
+
 
 def display_menu(
     ser: serial.Serial,
@@ -24,7 +98,7 @@ def display_menu(
     debug: bool = False,
 ) -> None:
     """
-    Display the BBS selection menu to the modem user.
+    Display the BBS selection menu to the modem user in a single write.
 
     Args:
         ser: Serial port object.
@@ -34,26 +108,20 @@ def display_menu(
         external_count: Number of external BBSes available.
         debug: Enable debug logging.
     """
-    logger.info(f"Displaying menu with {len(bbs_entries)} BBS entries")
+    logger.info("Displaying menu with %d BBS entries", len(bbs_entries))
 
-    safe_print(ser, "", term_type, debug=debug)
-    color_print(ser, welcome_message, Color.CYAN, term_type, debug=debug)
-    safe_print(ser, "", term_type, debug=debug)
-    color_print(ser, "=== BBS Directory ===", Color.YELLOW, term_type, debug=debug)
-    safe_print(ser, "", term_type, debug=debug)
+    data = render_menu(bbs_entries, welcome_message, term_type, external_count)
+    if debug:
+        logger.debug(f"Writing {len(data)} byte menu to modem")
+    ser.write(data)
+    ser.flush()
 
-    for i, bbs in enumerate(bbs_entries, start=1):
-        color_print(ser, f"{i}. {bbs.name}", Color.GREEN, term_type, debug=debug)
-        if bbs.description:
-            color_print(ser, f"   {bbs.description}", Color.WHITE, term_type, debug=debug)
 
-    safe_print(ser, "", term_type, debug=debug)
-
-    if external_count > 0:
-        color_print(ser, f"X. External BBSes ({external_count}+)", Color.CYAN, term_type, debug=debug)
-
-    color_print(ser, "0. Hang up", Color.RED, term_type, debug=debug)
-    safe_print(ser, "", term_type, debug=debug)
+@functools.lru_cache(maxsize=64)
+def _selection_prompt(max_choice: int, has_external: bool, term_type: TerminalType) -> bytes:
+    """Return the encoded main menu choice prompt; computed once per menu shape and terminal type."""
+    extra = ", X for external" if has_external else ""
+    return render_line(f"Enter choice (1-{max_choice}{extra}, 0 to hang up): ", term_type, Color.CYAN)
 
 
 def get_selection(
@@ -79,27 +147,29 @@ def get_selection(
         Selected BBSEntry, EXTERNAL_MENU constant, or None if user chose to hang up.
     """
     max_choice = len(bbs_entries)
-    prompt_extra = ", X for external" if has_external else ""
+    prompt = _selection_prompt(max_choice, has_external, term_type)
     timeout = idle_timeout if idle_timeout else None
 
     while True:
-        color_print(ser, f"Enter choice (1-{max_choice}{prompt_extra}, 0 to hang up): ", Color.CYAN, term_type, debug=debug)
+        if debug:
+            logger.debug(f"Writing to modem: {prompt!r}")
+        ser.write(prompt)
+        ser.flush()
         ch = modem_getch(ser, timeout=timeout, debug=debug)
         if ch is None:
             logger.info("Menu selection timed out due to inactivity")
             return None
-        ch_str = ch.decode(errors="ignore").upper()
+        key = ch[0] if ch else 0
 
         # Check for external menu
-        if has_external and ch_str == "X":
+        if has_external and key & _UPPER_MASK == ord("X"):
             logger.info("User selected external BBS menu")
             return EXTERNAL_MENU
 
-        try:
-            choice = int(ch_str)
-        except (ValueError, UnicodeDecodeError):
+        if not _DIGIT_0 <= key <= _DIGIT_9:
             color_print(ser, "Invalid input. Try again.", Color.RED, term_type, debug=debug)
             continue
+        choice = key - _DIGIT_0
 
         if choice == 0:
             logger.info("User chose to hang up")
@@ -107,13 +177,84 @@ def get_selection(
 
         if 1 <= choice <= max_choice:
             selected = bbs_entries[choice - 1]
-            logger.info(f"User selected BBS: {selected.name}")
+            logger.info("User selected BBS: %s", selected.name)
             color_print(ser, f"Connecting to {selected.name}...", Color.GREEN, term_type, debug=debug)
             return selected
 
         color_print(ser, f"Please enter 1-{max_choice} or 0.", Color.YELLOW, term_type, debug=debug)
 
 
+def _display_rows(entries: List[BBSEntry]) -> Tuple[str, ...]:
+    """
+    Return the display_row of every entry as a tuple parallel to entries.
+
+    The full external list is shown on every visit to the external menu, so
+    its rows are kept and reused while the same list object is passed in.
+
+    Args:
+        entries: BBS entries to be paged through.
+
+    Returns:
+        Tuple of menu rows, one per entry.
+    """
+    global _rows_source, _rows
+
+    if entries is not _rows_source:
+        _rows = tuple(bbs.display_row for bbs in entries)
+        _rows_source = entries
+        logger.debug(f"Built {len(_rows)} external menu rows")
+    return _rows
+
+
+def _format_page(
+    page_rows: Sequence[str],
+    page: int,
+    total_pages: int,
+    search_query: str,
+    result_count: int,
+    term_type: TerminalType,
+) -> bytes:
+    """
+    Render one page of the external BBS list: header, entries and navigation line.
+
+    Args:
+        page_rows: Menu rows (BBSEntry.display_row) on this page.
+        page: Zero-based page number.
+        total_pages: Number of pages in the current list.
+        search_query: Active search, or "" when browsing the full list.
+        result_count: Number of entries in the current (possibly filtered) list.
+        term_type: Terminal type for charset-safe output.
+
+    Returns:
+        The page, encoded for the terminal type.
+    """
+    blank = render_line("", term_type)
+    if search_query:
+        header = f'=== Search: "{search_query}" ({result_count} results) ==='
+    else:
+        header = f"=== External BBSes (Page {page + 1}/{total_pages}) ==="
+    lines = [blank, render_line(header, term_type, Color.YELLOW), blank]
+
+    for i, row in enumerate(page_rows, start=1):
+        lines.append(render_line(f"{i:2}. {row}", term_type, Color.GREEN))
+
+    lines.append(blank)
+
+    nav_options = []
+    if page < total_pages - 1:
+        nav_options.append("[N]ext")
+    if page > 0:
+        nav_options.append("[P]rev")
+    nav_options.append("[S]earch")
+    if search_query:
+        nav_options.append("[C]lear")
+    nav_options.append("[0] Back")
+
+    lines.append(render_line("  ".join(nav_options), term_type, Color.CYAN))
+    lines.append(blank)
+    return b"".join(lines)
+
+
 def display_external_menu(
     ser: serial.Serial,
     external_bbs: List[BBSEntry],
@@ -144,7 +285,18 @@ def display_external_menu(
     search_query = ""
     page = 0
 
+    # Menu rows parallel to display_list, rebuilt only when the list changes
+    rows_list = external_bbs
+    display_rows = _display_rows(external_bbs)
+
     while True:
+        if display_list is not rows_list:
+            if display_list is external_bbs:
+                display_rows = _display_rows(external_bbs)
+            else:
+                display_rows = tuple(bbs.display_row for bbs in display_list)
+            rows_list = display_list
+
         # Calculate pagination
         total_pages = (len(display_list) + page_size - 1) // page_size
         if total_pages == 0:
@@ -155,35 +307,13 @@ def display_external_menu(
         end_idx = min(start_idx + page_size, len(display_list))
         page_entries = display_list[start_idx:end_idx]
 
-        # Display header
-        safe_print(ser, "", term_type, debug=debug)
-        if search_query:
-            header = f'=== Search: "{search_query}" ({len(display_list)} results) ==='
-        else:
-            header = f"=== External BBSes (Page {page + 1}/{total_pages}) ==="
-        color_print(ser, header, Color.YELLOW, term_type, debug=debug)
-        safe_print(ser, "", term_type, debug=debug)
-
-        # Display entries
-        for i, bbs in enumerate(page_entries, start=1):
-            protocol_tag = f"[{bbs.protocol}]"
-            color_print(ser, f"{i:2}. {bbs.name[:30]:<30} {protocol_tag}", Color.GREEN, term_type, debug=debug)
-
-        safe_print(ser, "", term_type, debug=debug)
-
-        # Display navigation options
-        nav_options = []
-        if page < total_pages - 1:
-            nav_options.append("[N]ext")
-        if page > 0:
-            nav_options.append("[P]rev")
-        nav_options.append("[S]earch")
-        if search_query:
-            nav_options.append("[C]lear")
-        nav_options.append("[0] Back")
-
-        color_print(ser, "  ".join(nav_options), Color.CYAN, term_type, debug=debug)
-        safe_print(ser, "", term_type, debug=debug)
+        data = _format_page(
+            display_rows[start_idx:end_idx], page, total_pages, search_query, len(display_list), term_type,
+        )
+        if debug:
+            logger.debug(f"Writing {len(data)} byte external menu page to modem")
+        ser.write(data)
+        ser.flush()
 
         # Get selection
         result = get_external_selection(
@@ -258,30 +388,24 @@ def get_external_selection(
         if ch is None:
             logger.info("External menu selection timed out due to inactivity")
             return None
-        ch_str = ch.decode(errors="ignore").upper()
-
-        # Navigation commands
-        if ch_str == "N" and has_next:
-            return "next"
-        if ch_str == "P" and has_prev:
-            return "prev"
-        if ch_str == "S":
-            return "search"
-        if ch_str == "C" and has_clear:
-            return "clear"
-        if ch_str == "0":
-            return "back"
-
-        # Numeric selection
-        try:
-            choice = int(ch_str)
-            if 1 <= choice <= max_choice:
+        key = ch[0] if ch else 0
+
+        # Numeric selection (0 = back)
+        if _DIGIT_0 <= key <= _DIGIT_9:
+            choice = key - _DIGIT_0
+            if choice == 0:
+                return "back"
+            if choice <= max_choice:
                 selected = page_entries[choice - 1]
-                logger.info(f"User selected external BBS: {selected.name}")
+                logger.info("User selected external BBS: %s", selected.name)
                 color_print(ser, f"Connecting to {selected.name}...", Color.GREEN, term_type, debug=debug)
                 return selected
-        except ValueError:
-            pass
+        else:
+            # Navigation commands
+            command = _NAV_KEYS.get(key & _UPPER_MASK)
+            if command == "search" or (command == "next" and has_next) \
+                    or (command == "prev" and has_prev) or (command == "clear" and has_clear):
+                return command
 
         color_print(ser, "Invalid choice.", Color.RED, term_type, debug=debug)
 
@@ -302,9 +426,10 @@ def prompt_search_term(
     Returns:
         Search string entered by user.
     """
-    safe_print(ser, "", term_type, debug=debug)
-    color_print(ser, "Enter search term (searches name and description)", Color.CYAN, term_type, debug=debug)
-    color_print(ser, "Press Enter to cancel", Color.WHITE, term_type, debug=debug)
-    safe_print(ser, "", term_type, debug=debug)
+    with BufferedModemWriter(ser, debug=debug) as out:
+        safe_print(out, "", term_type, debug=debug)
+        color_print(out, "Enter search term (searches name and description)", Color.CYAN, term_type, debug=debug)
+        color_print(out, "Press Enter to cancel", Color.WHITE, term_type, debug=debug)
+        safe_print(out, "", term_type, debug=debug)
     search = modem_input(ser, prompt="Search: ", echo=True, debug=debug)
     return search.strip()
@@ -1,13 +1,165 @@
 """Modem serial I/O functions."""
 
+import functools
 import logging
+import os
+import re
+import select
 import time
-from typing import List, Optional
+import weakref
+from typing import Optional, Sequence, Tuple
 
 import serial
 
 logger = logging.getLogger(__name__)
 
+# Longest wait between reads when the port is non-blocking (serial_timeout: 0)
+NONBLOCKING_POLL_INTERVAL = 0.05
+
+# Most bytes modem_getch() takes from the port in one read
+GETCH_READ_MAX = 64
+
+# Bytes read by modem_getch()/modem_input() but not yet consumed, per port
+_typeahead: "weakref.WeakKeyDictionary[serial.Serial, bytearray]" = weakref.WeakKeyDictionary()
+
+# AT commands sent by init_modem() when no sequence is configured
+DEFAULT_INIT_SEQUENCE = ("ATZ", "AT&D0", "AT&C0", "ATV1", "ATS0=1")
+
+# Result codes, matched directly against raw modem bytes
+_CONNECT_RE = re.compile(rb"CONNECT", re.IGNORECASE)
+_HANGUP_RE = re.compile(rb"OK|NO CARRIER", re.IGNORECASE)
+_INIT_RE = re.compile(rb"OK|ERROR", re.IGNORECASE)
+
+# Bytes of already-scanned input re-checked with each new chunk, so a
+# result code split across reads is still found
+_SCAN_OVERLAP = 16
+# Discard old input while waiting for CONNECT once the buffer passes this size
+_CONNECT_BUF_MAX = 4096
+_CONNECT_BUF_KEEP = 256
+# Longest CONNECT line kept; a modem that never ends the line is cut off here
+_CONNECT_LINE_MAX = 128
+
+
+class BufferedModemWriter:
+    """
+    Collect modem output in memory and send it in a single serial write.
+
+    Stands in for the serial port when passed to the print helpers
+    (modem_print, safe_print, color_print): their per-line write/flush
+    calls are accumulated and sent together by send(), or on leaving the
+    context manager.
+    """
+
+    def __init__(self, ser: serial.Serial, debug: bool = False):
+        self.ser = ser
+        self.debug = debug
+        self._buf = bytearray()
+
+    def write(self, data: bytes) -> int:
+        """Buffer bytes for the next send()."""
+        self._buf += data
+        return len(data)
+
+    def flush(self) -> None:
+        """No-op; output is flushed to the modem by send()."""
+
+    def send(self) -> None:
+        """Write all buffered output to the modem and flush once."""
+        if not self._buf:
+            return
+        if self.debug:
+            logger.debug(f"Writing {len(self._buf)} buffered bytes to modem")
+        self.ser.write(bytes(self._buf))
+        self.ser.flush()
+        self._buf.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.send()
+
+
+def _read(ser: serial.Serial, size: int) -> bytes:
+    """
+    Read up to size bytes, blocking for at most the port's read timeout.
+
+    The kernel wakes us as soon as data arrives. Only when the port was
+    opened non-blocking (timeout=0) do we wait after an empty read, so
+    callers' loops don't spin; that wait also ends as soon as data arrives.
+
+    Args:
+        ser: Serial port object.
+        size: Maximum number of bytes to read.
+
+    Returns:
+        The bytes read; empty if the timeout expired with no data.
+    """
+    data = ser.read(size)
+    if not data and ser.timeout == 0:
+        _wait_readable(ser, NONBLOCKING_POLL_INTERVAL)
+    return data
+
+
+def read_available(ser: serial.Serial, timeout: float) -> bytes:
+    """
+    Wait up to timeout seconds for input, then return everything waiting.
+
+    The wait is bounded by the caller instead of the port's read timeout,
+    which is left alone: assigning ser.timeout makes pyserial reconfigure
+    the port.
+
+    Args:
+        ser: Serial port object.
+        timeout: Maximum seconds to wait for the first byte.
+
+    Returns:
+        The bytes read; empty if nothing arrived in time.
+    """
+    if not ser.in_waiting and not _wait_readable(ser, timeout):
+        return b""
+    return ser.read(ser.in_waiting or 1)
+
+
+def _wait_readable(ser: serial.Serial, timeout: float) -> bool:
+    """
+    Wait until the port has input or timeout seconds pass.
+
+    Uses select() on the port's file descriptor so the wait ends the moment
+    data arrives. On Windows, or for port objects without a usable
+    fileno(), it sleeps for at most NONBLOCKING_POLL_INTERVAL and then
+    checks in_waiting, so callers poll until their own deadline.
+
+    Args:
+        ser: Serial port object.
+        timeout: Maximum seconds to wait.
+
+    Returns:
+        True if input is waiting.
+    """
+    if os.name != "nt":
+        try:
+            return bool(select.select([ser], [], [], timeout)[0])
+        except (AttributeError, TypeError, ValueError, OSError):
+            pass
+    time.sleep(min(timeout, NONBLOCKING_POLL_INTERVAL))
+    return bool(ser.in_waiting)
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_command(cmd: str) -> bytes:
+    """Return an AT command encoded with its terminating CR; cached since the init sequence is fixed."""
+    return (cmd + "\r").encode()
+
+
+@functools.lru_cache(maxsize=256)
+def encode_line(text: str) -> bytes:
+    """Return text encoded for the modem with a trailing CRLF; cached since most lines are fixed prompts."""
+    if not text.endswith("\r\n"):
+        text = text + "\r\n"
+    return text.encode(errors="replace")
+
 
 def modem_print(ser: serial.Serial, text: str, debug: bool = False) -> None:
     """
@@ -18,10 +170,24 @@ def modem_print(ser: serial.Serial, text: str, debug: bool = False) -> None:
         text: Text to send.
         debug: Enable debug logging.
     """
-    if not text.endswith("\r\n"):
-        text = text + "\r\n"
-    btext = text.encode(errors="replace")
-    if debug:
+    btext = encode_line(text)
+    if debug and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Writing to modem: {btext!r}")
+    ser.write(btext)
+    ser.flush()
+
+
+def modem_print_lines(ser: serial.Serial, *lines: str, debug: bool = False) -> None:
+    """
+    Send several lines to the modem, each with CRLF, in one write and flush.
+
+    Args:
+        ser: Serial port object.
+        *lines: Lines of text to send.
+        debug: Enable debug logging.
+    """
+    btext = b"".join(encode_line(line) for line in lines)
+    if debug and logger.isEnabledFor(logging.DEBUG):
         logger.debug(f"Writing to modem: {btext!r}")
     ser.write(btext)
     ser.flush()
@@ -43,47 +209,55 @@ def modem_input(ser: serial.Serial, prompt: Optional[str] = None, echo: bool = T
     Returns:
         The input line (without line ending), or None if timed out.
     """
+    debug = debug and logger.isEnabledFor(logging.DEBUG)
     if prompt:
         # Use write directly to avoid adding CRLF for inline prompts
         ser.write(prompt.encode(errors="replace"))
         ser.flush()
         if debug:
             logger.debug(f"Writing prompt to modem: {prompt!r}")
-    buf = b""
-    deadline = time.time() + timeout if timeout else None
+    buf = bytearray()
+    mask = mask_char.encode() if mask_char else None
+    deadline = time.monotonic() + timeout if timeout else None
     while True:
-        if deadline and time.time() > deadline:
+        if deadline and time.monotonic() > deadline:
             logger.info(f"modem_input timed out after {timeout}s of inactivity")
             return None
-        waiting = ser.in_waiting
-        if waiting:
-            if debug:
-                logger.debug(f"Reading {waiting} bytes from modem during modem_input")
-            ch = ser.read(1)
-            if debug:
-                logger.debug(f"Read byte: {ch!r}")
-            if ch in (b'\r', b'\n'):
+        # Take everything already typed in one read; echo it in one write
+        chunk = take_typeahead(ser) or _read(ser, ser.in_waiting or 1)
+        if not chunk:
+            continue
+        if debug:
+            logger.debug("Read %d bytes: %r", len(chunk), chunk)
+        out = bytearray()
+        done = False
+        for i, byte in enumerate(chunk):
+            if byte in (0x0D, 0x0A):
                 if buf or allow_empty:
-                    if echo:
-                        ser.write(b"\r\n")
-                        ser.flush()
+                    out += b"\r\n"
+                    done = True
+                    # Keep anything typed after Enter for the next reader,
+                    # minus the LF of a CRLF pair
+                    rest = chunk[i + 1:]
+                    if byte == 0x0D and rest[:1] == b"\n":
+                        rest = rest[1:]
+                    if rest:
+                        _save_typeahead(ser, rest)
                     break
-                else:
-                    continue  # ignore leading newlines
+                continue  # ignore leading newlines
             # Handle backspace
-            if ch in (b'\x08', b'\x7f'):
+            if byte in (0x08, 0x7F):
                 if buf:
-                    buf = buf[:-1]
-                    if echo:
-                        ser.write(b"\x08 \x08")  # Backspace, space, backspace
-                        ser.flush()
+                    del buf[-1]
+                    out += b"\x08 \x08"  # Backspace, space, backspace
                 continue
-            buf += ch
-            if echo:
-                ser.write(mask_char.encode() if mask_char else ch)
-                ser.flush()
-        else:
-            time.sleep(0.05)
+            buf.append(byte)
+            out += mask if mask else bytes((byte,))
+        if echo and out:
+            ser.write(bytes(out))
+            ser.flush()
+        if done:
+            break
     return buf.decode(errors="replace")
 
 
@@ -91,6 +265,11 @@ def modem_getch(ser: serial.Serial, prompt: Optional[str] = None, timeout: Optio
     """
     Optionally send a prompt, then wait for and return a single character from the modem.
 
+    Everything already waiting on the port is taken in one read. Bytes
+    beyond the first are kept as typeahead for this port and handed out by
+    later modem_getch/modem_input calls, or forwarded by the bridge via
+    take_typeahead(), so a burst of keystrokes costs one read, not one per key.
+
     Args:
         ser: Serial port object.
         prompt: Optional prompt to display before reading.
@@ -100,22 +279,119 @@ def modem_getch(ser: serial.Serial, prompt: Optional[str] = None, timeout: Optio
     Returns:
         Single byte read from modem, or None if timed out.
     """
+    debug = debug and logger.isEnabledFor(logging.DEBUG)
     if prompt:
         modem_print(ser, prompt, debug=debug)
-    deadline = time.time() + timeout if timeout else None
-    while True:
-        if deadline and time.time() > deadline:
-            logger.info(f"modem_getch timed out after {timeout}s of inactivity")
-            return None
-        waiting = ser.in_waiting
-        if waiting:
-            if debug:
-                logger.debug(f"Reading {waiting} bytes from modem during modem_getch")
-            ch = ser.read(1)
-            if debug:
-                logger.debug(f"Read byte: {ch!r}")
-            return ch
-        time.sleep(0.05)
+    pending = _typeahead.get(ser)
+    if not pending:
+        deadline = time.monotonic() + timeout if timeout else None
+        while True:
+            if deadline and time.monotonic() > deadline:
+                logger.info(f"modem_getch timed out after {timeout}s of inactivity")
+                return None
+            chunk = _read(ser, min(ser.in_waiting, GETCH_READ_MAX) or 1)
+            if chunk:
+                break
+        if debug:
+            logger.debug("Read %d bytes: %r", len(chunk), chunk)
+        if len(chunk) == 1:
+            return chunk
+        _save_typeahead(ser, chunk[1:])
+        return chunk[:1]
+    ch = bytes(pending[:1])
+    del pending[:1]
+    return ch
+
+
+def _save_typeahead(ser: serial.Serial, data: bytes) -> None:
+    """Queue bytes read but not consumed, ahead of anything already queued for this port."""
+    pending = _typeahead.get(ser)
+    if pending is None:
+        _typeahead[ser] = bytearray(data)
+    else:
+        pending[:0] = data
+
+
+def take_typeahead(ser: serial.Serial) -> bytes:
+    """
+    Remove and return any bytes modem_getch()/modem_input() read ahead on this port.
+
+    Args:
+        ser: Serial port object.
+
+    Returns:
+        The unconsumed bytes, or b"" if there are none.
+    """
+    pending = _typeahead.get(ser)
+    if not pending:
+        return b""
+    data = bytes(pending)
+    pending.clear()
+    return data
+
+
+def enable_low_latency(ser: serial.Serial, debug: bool = False) -> bool:
+    """
+    Enable the kernel's ASYNC_LOW_LATENCY flag on the serial port.
+
+    USB-serial adapters (FTDI in particular) otherwise hold received bytes
+    for up to 16ms before handing them to userspace.
+
+    Args:
+        ser: Serial port object.
+        debug: Enable debug logging.
+
+    Returns:
+        True if low-latency mode was enabled, False if unsupported.
+    """
+    try:
+        ser.set_low_latency_mode(True)
+    except (AttributeError, NotImplementedError, ValueError) as e:
+        logger.info(f"Low-latency mode not available: {e}")
+        return False
+    if debug:
+        logger.debug("ASYNC_LOW_LATENCY enabled on serial port")
+    return True
+
+
+def _wait_for_response(ser: serial.Serial, expected: "re.Pattern[bytes]", timeout: float, debug: bool = False) -> Tuple[str, bool]:
+    """
+    Read modem output until one of the expected result codes arrives.
+
+    Returns as soon as a result code is seen rather than waiting out the
+    full timeout.
+
+    Args:
+        ser: Serial port object.
+        expected: Compiled bytes pattern matching the result codes to look for.
+        timeout: Maximum seconds to wait.
+        debug: Enable debug logging.
+
+    Returns:
+        Tuple of (stripped response text, True if a result code was seen).
+    """
+    debug = debug and logger.isEnabledFor(logging.DEBUG)
+    deadline = time.monotonic() + timeout
+    resp = bytearray()
+    while time.monotonic() < deadline:
+        chunk = _read(ser, ser.in_waiting or 1)
+        if not chunk:
+            continue
+        if debug:
+            logger.debug("Read %d bytes while waiting for %r: %r", len(chunk), expected.pattern, chunk)
+        scan_from = max(0, len(resp) - _SCAN_OVERLAP)
+        resp += chunk
+        if expected.search(resp, scan_from):
+            return resp.decode(errors="ignore").strip(), True
+    return resp.decode(errors="ignore").strip(), False
+
+
+def _carrier_up(ser: serial.Serial) -> bool:
+    """Return False only if the port reports carrier detect low; True if up or unknown."""
+    try:
+        return bool(ser.cd)
+    except Exception:
+        return True
 
 
 def force_hangup(ser: serial.Serial, debug: bool = False) -> None:
@@ -143,13 +419,17 @@ def force_hangup(ser: serial.Serial, debug: bool = False) -> None:
             logger.debug("DTR set to True")
         time.sleep(0.5)
 
-        # Guard time before escape
-        time.sleep(0.5)
-        if debug:
-            logger.debug("Writing to modem: b'+++'")
-        ser.write(b"+++")
-        ser.flush()
-        time.sleep(1)
+        if _carrier_up(ser):
+            # Guard time before escape
+            time.sleep(0.5)
+            if debug:
+                logger.debug("Writing to modem: b'+++'")
+            ser.write(b"+++")
+            ser.flush()
+            time.sleep(1)
+        else:
+            # DTR drop already hung up and left the modem in command mode
+            logger.info("Carrier dropped on DTR, skipping +++ escape")
 
         # Hang up
         if debug:
@@ -158,28 +438,49 @@ def force_hangup(ser: serial.Serial, debug: bool = False) -> None:
         ser.flush()
 
         # Wait for acknowledgement, up to 5 seconds
-        deadline = time.time() + 5.0
-        resp = ""
-        while time.time() < deadline:
-            waiting = ser.in_waiting
-            if waiting:
-                if debug:
-                    logger.debug(f"Reading {waiting} bytes from modem during hangup wait")
-                chunk = ser.read(waiting)
-                if debug:
-                    logger.debug(f"Read bytes: {chunk!r}")
-                chunk_decoded = chunk.decode(errors="ignore")
-                resp += chunk_decoded
-                if "OK" in resp.upper() or "NO CARRIER" in resp.upper():
-                    logger.info(f"Hangup response: {resp.strip()!r}")
-                    return
-            time.sleep(0.05)
-        logger.warning(f"Hangup timeout, last response: {resp.strip()!r}")
+        resp, matched = _wait_for_response(ser, _HANGUP_RE, 5.0, debug=debug)
+        if matched:
+            logger.info(f"Hangup response: {resp!r}")
+            return
+        logger.warning(f"Hangup timeout, last response: {resp!r}")
     except Exception as e:
         logger.error(f"force_hangup exception: {e}")
 
 
-def init_modem(ser: serial.Serial, init_sequence: Optional[List[str]] = None, debug: bool = False) -> None:
+def wait_modem_idle(ser: serial.Serial, timeout: float = 1.0, debug: bool = False) -> bool:
+    """
+    Wait for the modem to drop carrier (DCD low) after a hangup.
+
+    Polls DCD every 50ms and returns as soon as it drops, instead of
+    sleeping for the full timeout.
+
+    Args:
+        ser: Serial port object.
+        timeout: Maximum seconds to wait.
+        debug: Enable debug logging.
+
+    Returns:
+        True if carrier dropped, False if it was still up at the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if not ser.cd:
+                if debug:
+                    logger.debug("Carrier dropped, modem idle")
+                return True
+        except Exception as e:
+            logger.error(f"Could not read carrier detect: {e}")
+            return False
+        if time.monotonic() >= deadline:
+            # Expected with AT&C0, where DCD is forced high and never drops
+            if debug:
+                logger.debug(f"Carrier still up {timeout}s after hangup")
+            return False
+        time.sleep(0.05)
+
+
+def init_modem(ser: serial.Serial, init_sequence: Optional[Sequence[str]] = None, debug: bool = False) -> None:
     """
     Initialize the modem with AT commands.
 
@@ -189,32 +490,29 @@ def init_modem(ser: serial.Serial, init_sequence: Optional[List[str]] = None, de
         debug: Enable debug logging.
     """
     if init_sequence is None:
-        init_sequence = ["ATZ", "AT&D0", "AT&C0", "ATV1", "ATS0=1"]
+        init_sequence = DEFAULT_INIT_SEQUENCE
 
     logger.info("Initializing modem...")
     for cmd in init_sequence:
-        cmd_bytes = (cmd + "\r").encode()
+        cmd_bytes = _encode_command(cmd)
         if debug:
             logger.debug(f"Sending init command: {cmd_bytes!r}")
         ser.write(cmd_bytes)
         ser.flush()
         # Wait for response (up to 2 seconds)
-        deadline = time.time() + 2.0
-        resp = ""
-        while time.time() < deadline:
-            if ser.in_waiting:
-                chunk = ser.read(ser.in_waiting)
-                resp += chunk.decode(errors="ignore")
-                if "OK" in resp.upper() or "ERROR" in resp.upper():
-                    break
-            time.sleep(0.05)
-        resp_clean = resp.strip()
+        resp_clean, _ = _wait_for_response(ser, _INIT_RE, 2.0, debug=debug)
         if resp_clean:
             logger.info(f"  {cmd} -> {resp_clean!r}")
         else:
             logger.warning(f"  {cmd} -> no response")
 
 
+def _find_eol(buf: bytearray, start: int) -> int:
+    """Return the index of the first CR or LF at or after start, or -1."""
+    ends = [i for i in (buf.find(b"\r", start), buf.find(b"\n", start)) if i >= 0]
+    return min(ends) if ends else -1
+
+
 def wait_for_connect(ser: serial.Serial, debug: bool = False) -> str:
     """
     Wait for an incoming call and CONNECT response from the modem.
@@ -227,56 +525,54 @@ def wait_for_connect(ser: serial.Serial, debug: bool = False) -> str:
         The CONNECT string from the modem (e.g., "CONNECT 9600/ARQ/V42").
     """
     logger.info("Waiting for incoming call...")
-    buffer = ""
-    raw_buffer = ""  # Preserve original case for display
+    debug = debug and logger.isEnabledFor(logging.DEBUG)
+    show_traffic = logger.isEnabledFor(logging.INFO)
+    buf = bytearray()
+    start = -1
+    line_deadline = 0.0
     while True:
-        waiting = ser.in_waiting
-        if waiting:
-            if debug:
-                logger.debug(f"Reading {waiting} bytes from modem during connect wait")
-            data = ser.read(waiting)
+        data = _read(ser, ser.in_waiting or 1)
+        if data:
             if debug:
-                logger.debug(f"Read bytes: {data!r}")
-            data_decoded = data.decode(errors="ignore")
-            logger.info(f"Modem says: {data_decoded.strip()}")
-            raw_buffer += data_decoded
-            buffer += data_decoded.upper()
-            if "CONNECT" in buffer:
-                # Extract the CONNECT line from raw buffer
-                connect_string = ""
-                for line in raw_buffer.split('\n'):
-                    if "CONNECT" in line.upper():
-                        connect_string = line.strip()
-                        break
+                logger.debug("Read %d bytes: %r", len(data), data)
+            if show_traffic:
+                logger.info(f"Modem says: {data.decode(errors='ignore').strip()}")
+            if start < 0:
+                if len(buf) > _CONNECT_BUF_MAX:
+                    del buf[:len(buf) - _CONNECT_BUF_KEEP]
+                scan_from = max(0, len(buf) - _SCAN_OVERLAP)
+                buf += data
+                match = _CONNECT_RE.search(buf, scan_from)
+                if match:
+                    start = match.start()
+                    # Give the modem a moment to finish the line (rate/protocol suffix)
+                    line_deadline = time.monotonic() + 0.5
+            else:
+                buf += data
+        if start >= 0:
+            end = _find_eol(buf, start)
+            if end < 0 and len(buf) - start >= _CONNECT_LINE_MAX:
+                end = start + _CONNECT_LINE_MAX
+            if end >= 0 or time.monotonic() >= line_deadline:
+                connect_string = buf[start:end if end >= 0 else len(buf)].decode(errors="ignore").strip()
                 logger.info(f"CONNECT detected: {connect_string}")
-                # Flush input buffer
-                if hasattr(ser, 'reset_input_buffer'):
-                    if debug:
-                        logger.debug("Flushing modem input buffer (reset_input_buffer)")
-                    ser.reset_input_buffer()
-                else:
-                    if debug:
-                        logger.debug("Flushing modem input buffer (flushInput)")
-                    ser.flushInput()
                 time.sleep(0.1)  # Let any noise settle
-                # Drain any remaining characters
-                while ser.in_waiting:
-                    remaining = ser.in_waiting
-                    if debug:
-                        logger.debug(f"Draining {remaining} bytes from modem input buffer")
-                    ser.read(remaining)
+                flush_input_buffer(ser, debug=debug)
                 return connect_string
-        time.sleep(0.05)
 
 
 def flush_input_buffer(ser: serial.Serial, debug: bool = False) -> None:
     """
     Flush the serial input buffer.
 
+    reset_input_buffer() discards everything the kernel holds in one
+    tcflush(), so no read-until-empty pass is needed afterwards.
+
     Args:
         ser: Serial port object.
         debug: Enable debug logging.
     """
+    take_typeahead(ser)
     if hasattr(ser, 'reset_input_buffer'):
         if debug:
             logger.debug("Flushing modem input buffer (reset_input_buffer)")
@@ -285,10 +581,3 @@ def flush_input_buffer(ser: serial.Serial, debug: bool = False) -> None:
         if debug:
             logger.debug("Flushing modem input buffer (flushInput)")
         ser.flushInput()
-
-    # Drain any remaining characters
-    while ser.in_waiting:
-        remaining = ser.in_waiting
-        if debug:
-            logger.debug(f"Draining {remaining} bytes from modem input buffer")
-        ser.read(remaining)
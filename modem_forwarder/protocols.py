@@ -1,16 +1,170 @@
 """Protocol-specific connection handlers for telnet, SSH, and rlogin."""
 
+import errno
 import logging
+import os
+import selectors
 import socket
-from typing import Union
+import time
+from typing import Dict, List, Optional, Tuple, Union
 
 import serial
 
 from .config import BBSEntry
-from .modem import modem_print, modem_input, modem_getch
+from .modem import modem_print, modem_print_lines, modem_input, modem_getch
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait on one address before also trying the next (RFC 8305)
+CONNECT_ATTEMPT_DELAY = 0.25
+
+# Seconds a resolved BBS address list is reused before asking DNS again
+ADDR_CACHE_TTL = 300.0
+
+# (host, port) -> (monotonic expiry time, getaddrinfo results)
+_addr_cache: Dict[Tuple[str, int], Tuple[float, List[Tuple]]] = {}
+
+# paramiko module and a shared AutoAddPolicy, loaded on first SSH connection
+_paramiko = None
+_auto_add_policy = None
+
+
+def _get_paramiko():
+    """
+    Import paramiko on first use and keep it for later SSH connections.
+
+    Returns:
+        The paramiko module.
+
+    Raises:
+        ImportError: If paramiko is not installed.
+    """
+    global _paramiko, _auto_add_policy
+
+    if _paramiko is None:
+        import paramiko
+        _auto_add_policy = paramiko.AutoAddPolicy()
+        _paramiko = paramiko
+        logger.debug("Loaded paramiko for SSH connections")
+    return _paramiko
+
+
+def _interleave_families(infos: List[Tuple]) -> List[Tuple]:
+    """Order getaddrinfo results so address families alternate, keeping the resolver's first choice first."""
+    by_family = {}
+    for info in infos:
+        by_family.setdefault(info[0], []).append(info)
+    queues = list(by_family.values())
+    ordered = []
+    while queues:
+        for queue in queues:
+            ordered.append(queue.pop(0))
+        queues = [queue for queue in queues if queue]
+    return ordered
+
+
+def _resolve(host: str, port: int, debug: bool = False) -> List[Tuple]:
+    """
+    Resolve host:port for a TCP connection, reusing answers for ADDR_CACHE_TTL seconds.
+
+    Args:
+        host: Host name or address.
+        port: TCP port.
+        debug: Enable debug logging.
+
+    Returns:
+        getaddrinfo() results for SOCK_STREAM.
+    """
+    key = (host, port)
+    now = time.monotonic()
+    cached = _addr_cache.get(key)
+    if cached and cached[0] > now:
+        if debug:
+            logger.debug(f"Using cached addresses for {host}:{port}")
+        return cached[1]
+    infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    _addr_cache[key] = (now + ADDR_CACHE_TTL, infos)
+    return infos
+
+
+def _open_tcp(host: str, port: int, timeout: float, debug: bool = False) -> socket.socket:
+    """
+    Connect to host:port, racing its addresses Happy Eyeballs style.
+
+    Attempts start CONNECT_ATTEMPT_DELAY apart, alternating IPv6/IPv4, and
+    the first to complete wins, so a dead address family costs a quarter
+    second rather than a full timeout. Addresses come from _resolve(), so
+    redials skip the DNS lookup; a failed connect drops the cached answer.
+    The returned socket has TCP_NODELAY set and uses timeout for later
+    blocking operations, like socket.create_connection().
+
+    Args:
+        host: Host name or address.
+        port: TCP port.
+        timeout: Seconds to wait for any attempt to succeed.
+        debug: Enable debug logging.
+
+    Returns:
+        Connected socket.
+
+    Raises:
+        OSError: If no address could be connected (socket.timeout on timeout).
+    """
+    addrs = _interleave_families(_resolve(host, port, debug))
+    deadline = time.monotonic() + timeout
+    next_start = 0.0
+    sel = selectors.DefaultSelector()
+    pending = []
+    error = None
+    winner = None
+    try:
+        while winner is None:
+            now = time.monotonic()
+            if addrs and (now >= next_start or not pending):
+                family, sock_type, proto, _, sockaddr = addrs.pop(0)
+                sock = socket.socket(family, sock_type, proto)
+                sock.setblocking(False)
+                err = sock.connect_ex(sockaddr)
+                if err not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    error = OSError(err, os.strerror(err))
+                    sock.close()
+                    continue
+                if debug:
+                    logger.debug(f"Connecting to {sockaddr}")
+                sel.register(sock, selectors.EVENT_WRITE)
+                pending.append(sock)
+                next_start = now + CONNECT_ATTEMPT_DELAY
+            if not pending:
+                break
+            if now >= deadline:
+                _addr_cache.pop((host, port), None)
+                raise socket.timeout("timed out")
+            wait = deadline - now
+            if addrs:
+                wait = min(wait, max(0.0, next_start - now))
+            for key, _ in sel.select(wait):
+                sock = key.fileobj
+                sel.unregister(sock)
+                pending.remove(sock)
+                err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if err == 0:
+                    winner = sock
+                    break
+                error = OSError(err, os.strerror(err))
+                sock.close()
+    finally:
+        for sock in pending:
+            sock.close()
+        sel.close()
+
+    if winner is None:
+        # The host may have moved; resolve it again next time
+        _addr_cache.pop((host, port), None)
+        raise error or OSError(f"No addresses to connect to for {host}:{port}")
+    winner.settimeout(timeout)
+    winner.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return winner
+
 
 class SSHChannelWrapper:
     """Wrap paramiko channel to provide socket-like interface for selectors."""
@@ -34,6 +188,9 @@ class SSHChannelWrapper:
     def setblocking(self, flag: bool) -> None:
         self.channel.setblocking(flag)
 
+    def settimeout(self, timeout: Optional[float]) -> None:
+        self.channel.settimeout(timeout)
+
 
 def create_connection(
     bbs: BBSEntry,
@@ -85,8 +242,7 @@ def create_telnet_connection(
     try:
         if debug:
             logger.debug(f"Creating telnet connection to {bbs.host}:{bbs.port}")
-        sock = socket.create_connection((bbs.host, bbs.port), timeout=timeout)
-        return sock
+        return _open_tcp(bbs.host, bbs.port, timeout, debug)
     except Exception as e:
         logger.error(f"Telnet connection failed: {e}")
         return None
@@ -111,18 +267,15 @@ def create_ssh_connection(
         SSHChannelWrapper or None on failure.
     """
     try:
-        import paramiko
+        paramiko = _get_paramiko()
     except ImportError:
         logger.error("SSH support requires paramiko: pip install paramiko")
         modem_print(ser, "SSH not available (paramiko not installed)", debug=debug)
         return None
 
-    modem_print(ser, "", debug=debug)
-    modem_print(ser, f"SSH connection to {bbs.host}:{bbs.port}", debug=debug)
+    modem_print_lines(ser, "", f"SSH connection to {bbs.host}:{bbs.port}", "", debug=debug)
 
     while True:
-        modem_print(ser, "", debug=debug)
-
         username = modem_input(ser, prompt="Username: ", allow_empty=True, debug=debug)
 
         if username:
@@ -135,11 +288,12 @@ def create_ssh_connection(
                 logger.debug(f"Creating SSH connection to {bbs.host}:{bbs.port} as {username}")
 
             client = paramiko.SSHClient()
-            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            client.set_missing_host_key_policy(_auto_add_policy)
 
             connect_kwargs = {
                 "hostname": bbs.host,
                 "port": bbs.port,
+                "sock": _open_tcp(bbs.host, bbs.port, timeout, debug),
                 "timeout": timeout,
                 "look_for_keys": False,
                 "allow_agent": False,
@@ -173,6 +327,7 @@ def create_ssh_connection(
         choice = modem_getch(ser, prompt="(R)etry or (M)enu? ", debug=debug)
         if choice.upper() != b"R":
             return None
+        modem_print(ser, "", debug=debug)
 
 
 def create_rlogin_connection(
@@ -194,9 +349,7 @@ def create_rlogin_connection(
         Socket or None on failure.
     """
     # Prompt for credentials
-    modem_print(ser, "", debug=debug)
-    modem_print(ser, f"rlogin connection to {bbs.host}:{bbs.port}", debug=debug)
-    modem_print(ser, "", debug=debug)
+    modem_print_lines(ser, "", f"rlogin connection to {bbs.host}:{bbs.port}", "", debug=debug)
 
     username = modem_input(ser, prompt="Username: ", debug=debug)
     if not username:
@@ -207,14 +360,15 @@ def create_rlogin_connection(
         if debug:
             logger.debug(f"Creating rlogin connection to {bbs.host}:{bbs.port} as {username}")
 
-        sock = socket.create_connection((bbs.host, bbs.port), timeout=timeout)
+        sock = _open_tcp(bbs.host, bbs.port, timeout, debug)
+        # Notice a dead session instead of waiting on it forever
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
 
         # RFC 1282 rlogin handshake:
         # \0 + local_username + \0 + remote_username + \0 + terminal/speed + \0
-        handshake = b"\x00"  # Initial null
-        handshake += username.encode() + b"\x00"  # Local user
-        handshake += username.encode() + b"\x00"  # Remote user (same)
-        handshake += b"ansi/9600\x00"  # Terminal type/speed
+        # (local and remote user are the same)
+        user = username.encode()
+        handshake = b"\x00%b\x00%b\x00ansi/9600\x00" % (user, user)
 
         sock.sendall(handshake)
 
@@ -1,11 +1,14 @@
 """Download and parse syncterm.lst BBS directory."""
 
+import io
+import json
 import logging
 import re
 import urllib.request
 import urllib.error
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from .config import BBSEntry
 
@@ -26,51 +29,162 @@ DEFAULT_PORTS = {
     "rlogin": 513,
 }
 
+# Suffix of the file next to the cache holding the ETag/Last-Modified
+# of the cached download, for conditional requests
+VALIDATORS_SUFFIX = ".etag"
 
-def download_syncterm_list(url: str, cache_path: str) -> List[BBSEntry]:
+# Section header line: [BBS Name]
+_SECTION_RE = re.compile(rb"\[(.+)\]")
+
+
+def _text(value: bytes) -> str:
+    """Decode a syncterm.lst field value."""
+    return value.decode("utf-8", errors="replace")
+
+
+# syncterm.lst key (lower-case bytes) -> (parsed field name, converter)
+_FIELD_HANDLERS = {
+    b"connectiontype": ("protocol", lambda value: _text(value).lower()),
+    b"address": ("address", _text),
+    b"port": ("port", int),
+    b"comment": ("comment", _text),
+}
+
+# Number of recent search results kept per BBS list
+SEARCH_CACHE_SIZE = 64
+
+# List the search cache was built from (held so its id can't be reused)
+# and its recent results, keyed by lower-cased query
+_search_source: Optional[List[BBSEntry]] = None
+_search_cache: "OrderedDict[str, List[BBSEntry]]" = OrderedDict()
+# BBSEntry.search_text of each entry in _search_source, in order
+_search_texts: Tuple[str, ...] = ()
+
+
+def download_syncterm_list(url: str, cache_path: str) -> Optional[List[BBSEntry]]:
     """
     Download syncterm.lst from URL, fallback to cache on failure.
 
+    When a cached copy exists the request is conditional (ETag /
+    Last-Modified). A 304 reply means the list already loaded from that
+    cache is current, so nothing is downloaded, read or parsed.
+
     Args:
         url: URL to download from.
         cache_path: Path to local cache file.
 
     Returns:
-        List of BBSEntry objects.
+        List of BBSEntry objects, or None if the cached list is unchanged.
     """
     content = None
+    validators_path = Path(cache_path + VALIDATORS_SUFFIX)
+
+    # Ask the server to skip the body if our cached copy is still current
+    headers = {}
+    validators: dict = {}
+    if Path(cache_path).exists():
+        validators = _read_validators(validators_path)
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
 
     # Try downloading fresh list
     try:
         logger.info(f"Downloading external BBS list from {url}...")
-        with urllib.request.urlopen(url, timeout=30) as response:
-            content = response.read().decode("utf-8", errors="replace")
+        request = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(request, timeout=30) as response:
+            content = response.read()
+            validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
         logger.info(f"Downloaded {len(content)} bytes")
 
         # Save to cache
         try:
-            Path(cache_path).write_text(content, encoding="utf-8")
+            Path(cache_path).write_bytes(content)
+            validators_path.write_text(json.dumps(validators))
             logger.info(f"Cached BBS list to {cache_path}")
         except Exception as e:
             logger.warning(f"Could not cache BBS list: {e}")
 
-    except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError) as e:
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            logger.info("External BBS list not modified since last download")
+            _update_validators(validators_path, validators, e.headers or {})
+            return None
+        logger.warning(f"Could not download BBS list: {e}")
+    except (urllib.error.URLError, TimeoutError) as e:
         logger.warning(f"Could not download BBS list: {e}")
 
     # If download failed, try cache
     if content is None:
-        cache_file = Path(cache_path)
-        if cache_file.exists():
-            logger.info(f"Using cached BBS list from {cache_path}")
-            content = cache_file.read_text(encoding="utf-8")
-        else:
+        if not Path(cache_path).exists():
             logger.error("No external BBS list available (download failed, no cache)")
             return []
+        return load_syncterm_cache(cache_path)
 
     return parse_syncterm_lst(content)
 
 
-def parse_syncterm_lst(content: str) -> List[BBSEntry]:
+def _read_validators(path: Path) -> dict:
+    """
+    Read the ETag/Last-Modified values saved with the cached list.
+
+    Args:
+        path: Path to the validators file.
+
+    Returns:
+        Dict with "etag" and/or "last_modified", or {} if unavailable.
+    """
+    try:
+        validators = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return validators if isinstance(validators, dict) else {}
+
+
+def _update_validators(path: Path, validators: dict, headers) -> None:
+    """
+    Save any ETag/Last-Modified a 304 reply carried, keeping stored values it omitted.
+
+    Args:
+        path: Path to the validators file.
+        validators: The values sent with the conditional request.
+        headers: Headers of the 304 reply.
+    """
+    updated = {
+        "etag": headers.get("ETag") or validators.get("etag"),
+        "last_modified": headers.get("Last-Modified") or validators.get("last_modified"),
+    }
+    if updated == validators:
+        return
+    try:
+        path.write_text(json.dumps(updated))
+    except OSError as e:
+        logger.warning(f"Could not save BBS list validators: {e}")
+
+
+def load_syncterm_cache(cache_path: str) -> List[BBSEntry]:
+    """
+    Load the external BBS list from the local cache without touching the network.
+
+    Args:
+        cache_path: Path to local cache file.
+
+    Returns:
+        List of BBSEntry objects, or an empty list if there is no cache.
+    """
+    cache_file = Path(cache_path)
+    if not cache_file.exists():
+        logger.info(f"No cached BBS list at {cache_path}")
+        return []
+    logger.info(f"Using cached BBS list from {cache_path}")
+    return parse_syncterm_lst(cache_file.read_bytes())
+
+
+def parse_syncterm_lst(content: bytes) -> List[BBSEntry]:
     """
     Parse syncterm.lst INI-style format into BBSEntry list.
 
@@ -81,6 +195,9 @@ def parse_syncterm_lst(content: str) -> List[BBSEntry]:
             Port=23
             Comment=Description text
 
+    The file is parsed as bytes; only the values stored in a BBSEntry are
+    decoded (as UTF-8, replacing invalid sequences).
+
     Args:
         content: Raw content of syncterm.lst file.
 
@@ -91,15 +208,16 @@ def parse_syncterm_lst(content: str) -> List[BBSEntry]:
     current_name: Optional[str] = None
     current_data: dict = {}
 
-    for line in content.split("\n"):
+    # Iterate lines in place rather than splitting the whole file into a list
+    for line in io.BytesIO(content):
         line = line.rstrip()
 
         # Skip comments and empty lines
-        if not line or line.startswith(";"):
+        if not line or line[:1] == b";":
             continue
 
         # Check for section header [BBS Name]
-        section_match = re.match(r"^\[(.+)\]$", line)
+        section_match = _SECTION_RE.fullmatch(line) if line[:1] == b"[" else None
         if section_match:
             # Save previous entry if exists
             if current_name and current_data.get("address"):
@@ -108,32 +226,25 @@ def parse_syncterm_lst(content: str) -> List[BBSEntry]:
                     entries.append(entry)
 
             # Start new entry
-            current_name = section_match.group(1).strip()
+            current_name = _text(section_match.group(1).strip())
             current_data = {}
             continue
 
         # Parse key=value pairs (may be indented)
-        stripped = line.lstrip("\t ")
-        if "=" in stripped:
-            key, value = stripped.split("=", 1)
-            key = key.lower().strip()
-            value = value.strip()
-
-            if key == "connectiontype":
-                current_data["protocol"] = value.lower()
-            elif key == "address":
-                current_data["address"] = value
-            elif key == "port":
+        stripped = line.lstrip(b"\t ")
+        key, sep, value = stripped.partition(b"=")
+        if sep:
+            field = _FIELD_HANDLERS.get(key.lower().strip())
+            if field:
+                name, convert = field
                 try:
-                    current_data["port"] = int(value)
+                    current_data[name] = convert(value.strip())
                 except ValueError:
                     pass
-            elif key == "comment":
-                current_data["comment"] = value
         else:
             # Continuation of previous value (multiline comment)
             if current_data.get("comment"):
-                current_data["comment"] += " " + stripped
+                current_data["comment"] += " " + _text(stripped)
 
     # Don't forget the last entry
     if current_name and current_data.get("address"):
@@ -184,7 +295,10 @@ def search_bbs_list(bbs_list: List[BBSEntry], query: str) -> List[BBSEntry]:
     """
     Filter BBS list by search query.
 
-    Searches name and description (case-insensitive).
+    Searches name and description (case-insensitive). Results for the
+    last SEARCH_CACHE_SIZE queries are cached until a different list is
+    searched (e.g. after the external list is refreshed); the returned
+    list is shared and must not be modified.
 
     Args:
         bbs_list: List of BBSEntry to search.
@@ -193,15 +307,26 @@ def search_bbs_list(bbs_list: List[BBSEntry], query: str) -> List[BBSEntry]:
     Returns:
         Filtered list of matching entries.
     """
+    global _search_source, _search_texts
+
     if not query:
         return bbs_list
 
     query_lower = query.lower()
-    results = []
-
-    for bbs in bbs_list:
-        if (query_lower in bbs.name.lower() or
-                query_lower in bbs.description.lower()):
-            results.append(bbs)
-
+    if bbs_list is not _search_source:
+        _search_cache.clear()
+        _search_source = bbs_list
+        _search_texts = tuple(bbs.search_text for bbs in bbs_list)
+    else:
+        cached = _search_cache.get(query_lower)
+        if cached is not None:
+            _search_cache.move_to_end(query_lower)
+            logger.debug(f"Search cache hit for {query_lower!r}")
+            return cached
+
+    results = [bbs for bbs, text in zip(bbs_list, _search_texts) if query_lower in text]
+
+    _search_cache[query_lower] = results
+    if len(_search_cache) > SEARCH_CACHE_SIZE:
+        _search_cache.popitem(last=False)
     return results
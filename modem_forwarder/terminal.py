@@ -1,13 +1,14 @@
 """Terminal type detection and charset-safe output."""
 
 import logging
+import re
 import time
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 
 import serial
 
-from .modem import modem_print, modem_getch
+from .modem import encode_line, flush_input_buffer, modem_print, modem_getch, read_available
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +45,25 @@ ANSI_COLORS = {
     Color.PURPLE: "\x1b[35m",
 }
 
+# Terminal types bound once for the per-line dispatch in render_line/colorize
+_PETSCII = TerminalType.PETSCII
+# Terminal types that take ANSI SGR color codes
+_ANSI_FAMILY = frozenset((TerminalType.ANSI, TerminalType.VT100))
+
+# (terminal type, color) -> code string for get_color_code. ASCII has no
+# color support and PETSCII uses bytes (handled separately), so only the
+# ANSI-family terminals have entries.
+_COLOR_CODES = {
+    (term_type, color): code
+    for term_type in _ANSI_FAMILY
+    for color, code in ANSI_COLORS.items()
+}
+
+# The same codes pre-encoded, plus the reset + CRLF that ends every colored line
+ANSI_COLORS_BYTES = {color: code.encode() for color, code in ANSI_COLORS.items()}
+_ANSI_RESET_BYTES = ANSI_COLORS_BYTES[Color.RESET]
+ANSI_LINE_END = _ANSI_RESET_BYTES + b"\r\n"
+
 # PETSCII color control characters - stored as bytes to avoid UTF-8 encoding issues
 # Values above 127 would be mangled by UTF-8 encoding (e.g., \x9f becomes \xc2\x9f)
 PETSCII_COLORS_BYTES = {
@@ -57,12 +77,21 @@ PETSCII_COLORS_BYTES = {
     Color.PURPLE: b"\x9c",     # CHR$(156) = purple
 }
 
+# Byte table swapping ASCII letter case, for ascii_to_petscii_bytes
+_PETSCII_CASE_SWAP = bytes.maketrans(
+    bytes(range(ord("A"), ord("Z") + 1)) + bytes(range(ord("a"), ord("z") + 1)),
+    bytes(range(ord("a"), ord("z") + 1)) + bytes(range(ord("A"), ord("Z") + 1)),
+)
+
 
 # ANSI escape sequence to request cursor position
 ANSI_CURSOR_POSITION_REQUEST = b"\x1b[6n"
 
 # Expected response pattern: ESC [ row ; col R
-# We just check for ESC [ ... R pattern
+_ANSI_CPR_RE = re.compile(rb"\x1b\[\d+;\d+R")
+# Already-scanned bytes re-checked with each chunk, so a reply split
+# across reads is still found
+_CPR_SCAN_OVERLAP = 16
 
 
 def detect_terminal(ser: serial.Serial, timeout: float = 2.0, debug: bool = False) -> Optional[TerminalType]:
@@ -82,10 +111,10 @@ def detect_terminal(ser: serial.Serial, timeout: float = 2.0, debug: bool = Fals
         Detected TerminalType, or None if detection failed.
     """
     logger.info("Attempting terminal type detection...")
+    debug = debug and logger.isEnabledFor(logging.DEBUG)
 
     # Clear any pending input
-    while ser.in_waiting:
-        ser.read(ser.in_waiting)
+    flush_input_buffer(ser, debug=debug)
 
     # Send ANSI cursor position request
     if debug:
@@ -94,33 +123,58 @@ def detect_terminal(ser: serial.Serial, timeout: float = 2.0, debug: bool = Fals
     ser.flush()
 
     # Wait for response
-    deadline = time.time() + timeout
-    response = b""
+    deadline = time.monotonic() + timeout
+    response = bytearray()
 
-    while time.time() < deadline:
-        if ser.in_waiting:
-            chunk = ser.read(ser.in_waiting)
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        # Blocks until the reply arrives, but never past the detection deadline
+        chunk = read_available(ser, remaining)
+        if chunk:
+            scan_from = max(0, len(response) - _CPR_SCAN_OVERLAP)
             response += chunk
             if debug:
-                logger.debug(f"Received during detection: {chunk!r}")
+                logger.debug("Received %d bytes during detection: %r", len(chunk), chunk)
 
             # Check for ANSI response pattern: ESC [ digits ; digits R
-            if b"\x1b[" in response and b"R" in response:
+            if _ANSI_CPR_RE.search(response, scan_from):
                 logger.info("Detected ANSI/VT100 terminal (responded to cursor position request)")
                 # Determine if it's ANSI or VT100 - for now treat as ANSI
                 return TerminalType.ANSI
 
-        time.sleep(0.05)
-
     # No ANSI response - could be PETSCII or plain ASCII
     if response:
         # Got some response but not ANSI - might be PETSCII echoing back
-        logger.info(f"Got non-ANSI response during detection: {response!r}")
+        logger.info(f"Got non-ANSI response during detection: {bytes(response)!r}")
 
     logger.info("Terminal detection inconclusive, will prompt user")
     return None
 
 
+# Terminal type menu and retry messages sent by prompt_terminal_type, each
+# ending with the choice prompt; encoded once at import
+_TERMINAL_PROMPT = "Enter choice (1-3): "
+_TERMINAL_MENU_BYTES = b"".join(encode_line(line) for line in (
+    "",
+    "Select your terminal type:",
+    "1. PETSCII (Commodore)",
+    "2. ANSI",
+    "3. ASCII (plain text)",
+    "",
+    _TERMINAL_PROMPT,
+))
+_TERMINAL_OUT_OF_RANGE_BYTES = encode_line("Please enter 1, 2, or 3.") + encode_line(_TERMINAL_PROMPT)
+_TERMINAL_INVALID_BYTES = encode_line("Invalid input. Please enter 1-3.") + encode_line(_TERMINAL_PROMPT)
+# Menu key -> terminal type
+_TERMINAL_CHOICES = {
+    b"1": TerminalType.PETSCII,
+    b"2": TerminalType.ANSI,
+    b"3": TerminalType.ASCII,
+}
+
+
 def prompt_terminal_type(ser: serial.Serial, debug: bool = False) -> TerminalType:
     """
     Ask user to select terminal type.
@@ -134,33 +188,23 @@ def prompt_terminal_type(ser: serial.Serial, debug: bool = False) -> TerminalTyp
     """
     logger.info("Prompting user for terminal type selection")
 
-    modem_print(ser, "", debug=debug)
-    modem_print(ser, "Select your terminal type:", debug=debug)
-    modem_print(ser, "1. PETSCII (Commodore)", debug=debug)
-    modem_print(ser, "2. ANSI", debug=debug)
-    modem_print(ser, "3. ASCII (plain text)", debug=debug)
-    modem_print(ser, "", debug=debug)
+    debug = debug and logger.isEnabledFor(logging.DEBUG)
 
+    # The menu and the first prompt go out in one write; after a bad key,
+    # the error message and the repeated prompt do
+    data = _TERMINAL_MENU_BYTES
     while True:
-        ch = modem_getch(ser, prompt="Enter choice (1-3): ", debug=debug)
-
-        try:
-            choice = int(ch.decode(errors="ignore"))
-        except (ValueError, UnicodeDecodeError):
-            modem_print(ser, "Invalid input. Please enter 1-3.", debug=debug)
-            continue
-
-        if choice == 1:
-            logger.info("User selected PETSCII terminal")
-            return TerminalType.PETSCII
-        elif choice == 2:
-            logger.info("User selected ANSI terminal")
-            return TerminalType.ANSI
-        elif choice == 3:
-            logger.info("User selected ASCII terminal")
-            return TerminalType.ASCII
-        else:
-            modem_print(ser, "Please enter 1, 2, or 3.", debug=debug)
+        if debug:
+            logger.debug(f"Writing to modem: {data!r}")
+        ser.write(data)
+        ser.flush()
+        ch = modem_getch(ser, debug=debug)
+
+        selected = _TERMINAL_CHOICES.get(ch)
+        if selected is not None:
+            logger.info(f"User selected {selected.name} terminal")
+            return selected
+        data = _TERMINAL_OUT_OF_RANGE_BYTES if ch.isdigit() else _TERMINAL_INVALID_BYTES
 
 
 def get_terminal_type(ser: serial.Serial, timeout: float = 2.0, debug: bool = False) -> TerminalType:
@@ -205,6 +249,21 @@ def ascii_to_petscii(text: str) -> str:
     return text.swapcase()
 
 
+def ascii_to_petscii_bytes(data: bytes) -> bytes:
+    """
+    Byte-level ascii_to_petscii for already-encoded text.
+
+    Only the ASCII letters are swapped, via a single translate() call.
+
+    Args:
+        data: Encoded text to convert.
+
+    Returns:
+        Bytes with ASCII letter case swapped for PETSCII display.
+    """
+    return data.translate(_PETSCII_CASE_SWAP)
+
+
 def get_color_code(color: Color, term_type: TerminalType) -> str:
     """
     Get the color escape/control code for a terminal type.
@@ -216,12 +275,7 @@ def get_color_code(color: Color, term_type: TerminalType) -> str:
     Returns:
         Color code string, or empty string for ASCII/PETSCII (no color support via string).
     """
-    if term_type in (TerminalType.ANSI, TerminalType.VT100):
-        return ANSI_COLORS.get(color, "")
-    else:
-        # ASCII has no color support
-        # PETSCII uses bytes, not strings (handled separately)
-        return ""
+    return _COLOR_CODES.get((term_type, color), "")
 
 
 def get_petscii_color_bytes(color: Color) -> bytes:
@@ -237,22 +291,26 @@ def get_petscii_color_bytes(color: Color) -> bytes:
     return PETSCII_COLORS_BYTES.get(color, b"")
 
 
-def colorize(text: str, color: Color, term_type: TerminalType) -> str:
+def colorize(text: Union[str, bytes], color: Color, term_type: TerminalType) -> Union[str, bytes]:
     """
     Wrap text with color codes for the terminal type (ANSI/VT100 only).
 
     Args:
-        text: Text to colorize.
+        text: Text to colorize. Already-encoded bytes are wrapped with the
+            pre-encoded codes and returned as bytes.
         color: Color to apply.
         term_type: Target terminal type.
 
     Returns:
         Text with color codes prepended (and reset appended for ANSI).
     """
-    if term_type == TerminalType.ASCII or term_type == TerminalType.PETSCII:
+    if term_type not in _ANSI_FAMILY:
         # ASCII has no colors, PETSCII handled separately with bytes
         return text
 
+    if isinstance(text, bytes):
+        return ANSI_COLORS_BYTES.get(color, b"") + text + _ANSI_RESET_BYTES
+
     color_code = get_color_code(color, term_type)
     reset_code = get_color_code(Color.RESET, term_type)
 
@@ -260,6 +318,30 @@ def colorize(text: str, color: Color, term_type: TerminalType) -> str:
     return f"{color_code}{text}{reset_code}"
 
 
+def render_line(text: str, term_type: TerminalType, color: Optional[Color] = None) -> bytes:
+    """
+    Render one line of output as the bytes safe_print/color_print send.
+
+    Args:
+        text: Text to output.
+        term_type: Target terminal type.
+        color: Color to apply, or None for uncolored text.
+
+    Returns:
+        Encoded, CRLF-terminated line, including any color codes.
+    """
+    if term_type is _PETSCII:
+        # PETSCII: color byte kept as raw bytes (avoids UTF-8 encoding issues),
+        # then the case-swapped text
+        color_bytes = get_petscii_color_bytes(color) if color is not None else b""
+        return color_bytes + ascii_to_petscii_bytes(encode_line(text))
+    if color is not None and term_type in _ANSI_FAMILY:
+        # Splice the pre-encoded SGR codes around the encoded text
+        return ANSI_COLORS_BYTES.get(color, b"") + text.encode(errors="replace") + ANSI_LINE_END
+    # ASCII (and uncolored text) has no color codes
+    return encode_line(text)
+
+
 def safe_print(ser: serial.Serial, text: str, term_type: TerminalType, debug: bool = False) -> None:
     """
     Output text in a charset-safe manner for the terminal type.
@@ -273,10 +355,11 @@ def safe_print(ser: serial.Serial, text: str, term_type: TerminalType, debug: bo
         term_type: Target terminal type.
         debug: Enable debug logging.
     """
-    if term_type == TerminalType.PETSCII:
-        text = ascii_to_petscii(text)
-
-    modem_print(ser, text, debug=debug)
+    data = render_line(text, term_type)
+    if debug and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Writing to modem: {data!r}")
+    ser.write(data)
+    ser.flush()
 
 
 def color_print(
@@ -296,17 +379,8 @@ def color_print(
         term_type: Target terminal type.
         debug: Enable debug logging.
     """
-    if term_type == TerminalType.PETSCII:
-        # PETSCII: Write color byte directly (avoids UTF-8 encoding issues)
-        color_bytes = get_petscii_color_bytes(color)
-        if color_bytes:
-            if debug:
-                logger.debug(f"Writing PETSCII color byte: {color_bytes!r}")
-            ser.write(color_bytes)
-            ser.flush()
-        # Then write the case-swapped text
-        modem_print(ser, ascii_to_petscii(text), debug=debug)
-    else:
-        # ANSI/VT100/ASCII: Use string-based colorization
-        colored_text = colorize(text, color, term_type)
-        modem_print(ser, colored_text, debug=debug)
+    data = render_line(text, term_type, color)
+    if debug and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Writing to modem: {data!r}")
+    ser.write(data)
+    ser.flush()
@@ -1,5 +1,9 @@
 """Pytest fixtures for Modem Forwarder tests."""
 
+import os
+import socket
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import MagicMock, PropertyMock
 from io import BytesIO
@@ -29,8 +33,39 @@ def mock_socket():
 
 
 @pytest.fixture
-def sample_config_yaml(tmp_path):
-    """Create a sample config.yaml file for testing."""
+def bridge_io(mock_serial, mocker):
+    """
+    Real file descriptors for driving bridge_session.
+
+    mock_serial is a local-mode port whose fileno() is the read end of a
+    pipe; bytes written to modem_in arrive as modem input. The BBS is one
+    end of a socketpair, handed to bridge_session via create_connection;
+    the test talks to it through bbs.
+    """
+    from modem_forwarder.config import BBSEntry
+
+    read_fd, write_fd = os.pipe()
+    bbs_side, remote = socket.socketpair()
+    mock_serial.is_local = True
+    mock_serial.READ_SIZE = 4096
+    mock_serial.read_buffered.return_value = b""
+    mock_serial.fileno.return_value = read_fd
+    mocker.patch("modem_forwarder.bridge.create_connection", return_value=bbs_side)
+    yield SimpleNamespace(
+        ser=mock_serial,
+        modem_in=write_fd,
+        bbs=remote,
+        entry=BBSEntry(name="Test", host="localhost", port=23),
+    )
+    remote.close()
+    bbs_side.close()
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+@pytest.fixture(scope="session")
+def sample_config_yaml(tmp_path_factory):
+    """Create a sample config.yaml file, shared read-only by the session."""
     config_content = """
 global:
   modem_port: "/dev/ttyUSB0"
@@ -56,32 +91,32 @@ bbs_entries:
       - wait: "password:"
       - send: "testpass"
 """
-    config_file = tmp_path / "config.yaml"
+    config_file = tmp_path_factory.mktemp("cfg") / "config.yaml"
     config_file.write_text(config_content)
     return str(config_file)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_bbs_entries():
-    """Sample BBS entries for testing."""
-    from modem_forwarder.config import BBSEntry, AutoLoginStep
+    """Sample BBS entries for testing, shared by the session as a read-only tuple."""
+    from modem_forwarder.config import BBSEntry
 
-    return [
+    return (
         BBSEntry(
             name="Test BBS 1",
             description="A test BBS",
             host="test1.example.com",
             port=23,
-            auto_login=None,
+            auto_login_raw=None,
         ),
         BBSEntry(
             name="Test BBS 2",
             description="Another test BBS",
             host="test2.example.com",
             port=6400,
-            auto_login=[
-                AutoLoginStep(action="wait", value="login:"),
-                AutoLoginStep(action="send", value="testuser"),
+            auto_login_raw=[
+                {"wait": "login:"},
+                {"send": "testuser"},
             ],
         ),
-    ]
+    )
@@ -1,5 +1,7 @@
 """Tests for auto-login module."""
 
+import socket
+
 import pytest
 from unittest.mock import MagicMock, patch
 import time
@@ -59,6 +61,33 @@ class TestExecuteAutologin:
 
         assert result is True
 
+    def test_execute_autologin_wait_split_target(self, mock_socket):
+        """Test wait action when the target arrives across several reads."""
+        steps = [
+            AutoLoginStep(action="wait", value="Login:"),
+        ]
+
+        mock_socket.recv.side_effect = [b"Welcome!\nLOG", b"IN", b": "]
+
+        result = execute_autologin(mock_socket, steps, timeout=1.0)
+
+        assert result is True
+        assert mock_socket.recv.call_count == 3
+
+    @pytest.mark.parametrize("target, received", [
+        ("ÉTAPE", "ÉTAPE 1"),
+        ("ÉTAPE", "étape 1"),
+        ("étape", "ÉTAPE 1"),
+    ])
+    def test_execute_autologin_wait_non_ascii_ignores_case(self, mock_socket, target, received):
+        """Test that non-ASCII targets match case-insensitively."""
+        steps = [AutoLoginStep(action="wait", value=target)]
+        mock_socket.recv.side_effect = [received.encode()]
+
+        result = execute_autologin(mock_socket, steps, timeout=1.0)
+
+        assert result is True
+
     def test_execute_autologin_wait_timeout(self, mock_socket):
         """Test wait action timeout."""
         steps = [
@@ -72,6 +101,20 @@ class TestExecuteAutologin:
 
         assert result is False
 
+    def test_execute_autologin_wait_silent_blocking_socket(self):
+        """Test that a wait on a blocking socket that never sends still times out."""
+        local, remote = socket.socketpair()
+        try:
+            local.setblocking(True)
+            steps = [AutoLoginStep(action="wait", value="login:")]
+
+            result = execute_autologin(local, steps, timeout=0.2)
+
+            assert result is False
+        finally:
+            local.close()
+            remote.close()
+
     def test_execute_autologin_wait_connection_closed(self, mock_socket):
         """Test wait action when connection closes."""
         steps = [
@@ -0,0 +1,139 @@
+"""Tests for bridge module."""
+
+import os
+import selectors
+import threading
+import time
+from itertools import chain, repeat
+from unittest.mock import PropertyMock
+
+import pytest
+
+from modem_forwarder.bridge import ModemWriteCoalescer, bridge_session
+from modem_forwarder.config import GlobalConfig
+from modem_forwarder.local_serial import LocalSerial
+
+
+class TestModemWriteCoalescer:
+    """Tests for BBS->modem write coalescing."""
+
+    def test_small_writes_are_buffered(self, mock_serial):
+        """Test that small chunks are held until flushed."""
+        out = ModemWriteCoalescer(mock_serial, max_bytes=64, delay=0.02)
+
+        out.append(b"ab")
+        out.append(b"cd")
+
+        mock_serial.write.assert_not_called()
+        out.flush()
+        mock_serial.write.assert_called_once_with(b"abcd")
+        mock_serial.flush.assert_not_called()
+
+    def test_flush_at_size_threshold(self, mock_serial):
+        """Test that reaching max_bytes writes the buffer immediately."""
+        out = ModemWriteCoalescer(mock_serial, max_bytes=4, delay=10)
+
+        out.append(b"ab")
+        out.append(b"cdef")
+
+        mock_serial.write.assert_called_once_with(b"abcdef")
+        assert out.deadline is None
+
+    def test_large_chunk_written_directly(self, mock_serial):
+        """Test that a large chunk with nothing buffered skips the buffer."""
+        out = ModemWriteCoalescer(mock_serial, max_bytes=4)
+
+        out.append(b"abcdefgh")
+
+        mock_serial.write.assert_called_once_with(b"abcdefgh")
+
+    def test_flush_if_due_after_delay(self, mock_serial, mocker):
+        """Test that buffered data is written once the delay expires."""
+        clock = mocker.patch("modem_forwarder.bridge.time.monotonic", return_value=100.0)
+        out = ModemWriteCoalescer(mock_serial, max_bytes=64, delay=0.02)
+        out.append(b"x")
+
+        out.flush_if_due()
+        mock_serial.write.assert_not_called()
+        assert out.timeout(1) == pytest.approx(0.02)
+        assert out.timeout(None) == pytest.approx(0.02)
+
+        clock.return_value = 100.05
+        out.flush_if_due()
+        mock_serial.write.assert_called_once_with(b"x")
+        assert out.timeout(1) == 1
+        assert out.timeout(None) is None
+
+
+class TestBridgeSession:
+    """Tests for the bridge loop."""
+
+    def test_shared_selector_left_open_and_empty(self, bridge_io):
+        """Test that a caller-supplied selector is cleaned up but not closed."""
+        bridge_io.bbs.close()  # BBS hangs up straight away
+        sel = selectors.DefaultSelector()
+
+        try:
+            bridge_session(bridge_io.ser, bridge_io.entry, GlobalConfig(), sel=sel)
+
+            assert len(sel.get_map()) == 0
+            sel.register(bridge_io.ser.fileno(), selectors.EVENT_READ)  # still usable
+        finally:
+            sel.close()
+
+    def test_idle_timeout_ends_session(self, bridge_io):
+        """Test that an idle session ends once idle_timeout has passed."""
+        bridge_session(bridge_io.ser, bridge_io.entry, GlobalConfig(idle_timeout=0.05))
+
+        output = b"".join(c[0][0] for c in bridge_io.ser.write.call_args_list)
+        assert b"Session timed out" in output
+
+    def test_bbs_output_reaches_modem(self, bridge_io):
+        """Test that BBS data is written to the modem before the session ends."""
+        bridge_io.bbs.sendall(b"Welcome to the BBS")
+        bridge_io.bbs.close()
+
+        bridge_session(bridge_io.ser, bridge_io.entry, GlobalConfig())
+
+        output = b"".join(c[0][0] for c in bridge_io.ser.write.call_args_list)
+        assert output == b"Welcome to the BBS"
+
+    def test_local_serial_buffer_reaches_bbs(self, bridge_io, mocker):
+        """Test that input LocalSerial buffered at the menu is forwarded without more stdin."""
+        master, slave = os.openpty()
+        mocker.patch("sys.stdin").fileno.return_value = slave
+        mocker.patch("sys.stdout").fileno.return_value = slave
+        ser = LocalSerial()
+        try:
+            os.write(master, b"1hello")
+            assert ser.read(1) == b"1"  # menu keypress; the rest stays buffered
+
+            bridge_session(ser, bridge_io.entry, GlobalConfig(idle_timeout=0.2))
+        finally:
+            ser.close()
+            os.close(master)
+            os.close(slave)
+
+        assert bridge_io.bbs.recv(100) == b"hello"
+
+    def test_carrier_loss_seen_after_modem_goes_quiet(self, bridge_io, mocker):
+        """Test that a throttled carrier check still runs once the modem goes silent."""
+        bridge_io.ser.is_local = False
+        # Carrier is up for the first check, then the caller hangs up
+        cd = PropertyMock(side_effect=chain([True], repeat(False)))
+        type(bridge_io.ser).cd = cd
+        mocker.patch("modem_forwarder.bridge.force_hangup")
+
+        # Typing, then the modem's final bytes well inside CD_CHECK_INTERVAL
+        os.write(bridge_io.modem_in, b"hello")
+        timer = threading.Timer(0.05, os.write, (bridge_io.modem_in, b"\r\nNO CARRIER\r\n"))
+        timer.start()
+        start = time.monotonic()
+        try:
+            bridge_session(bridge_io.ser, bridge_io.entry, GlobalConfig(idle_timeout=5))
+            elapsed = time.monotonic() - start
+        finally:
+            timer.join()
+
+        assert elapsed < 1.0
+        assert cd.call_count == 2
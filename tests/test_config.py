@@ -1,5 +1,8 @@
 """Tests for config module."""
 
+import dataclasses
+import shutil
+
 import pytest
 from modem_forwarder.config import (
     load_config,
@@ -38,6 +41,40 @@ class TestLoadConfig:
         assert bbs2.auto_login is not None
         assert len(bbs2.auto_login) == 4
 
+    def test_load_config_cached_until_file_changes(self, sample_config_yaml, tmp_path):
+        """Test that an unchanged file returns the cached Config."""
+        # Edit a private copy; the fixture file is shared by the session
+        config_file = str(tmp_path / "config.yaml")
+        shutil.copy(sample_config_yaml, config_file)
+        first = load_config(config_file)
+        assert load_config(config_file) is first
+
+        with open(config_file, "a") as f:
+            f.write("# edited\n")
+        assert load_config(config_file) is not first
+
+    def test_load_config_uses_json_sidecar(self, sample_config_yaml, mocker):
+        """Test that a fresh JSON sidecar is loaded instead of the YAML."""
+        first = load_config(sample_config_yaml)
+        mocker.patch.dict("modem_forwarder.config._CONFIG_CACHE", clear=True)
+        yaml_load = mocker.patch("modem_forwarder.config.yaml.load")
+
+        config = load_config(sample_config_yaml)
+
+        yaml_load.assert_not_called()
+        assert config == first
+
+    def test_json_sidecar_is_owner_only(self, tmp_path):
+        """Test that the JSON sidecar, which holds passwords, is not world-readable."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("global: {}\nbbs_entries: []\n")
+        config_file.chmod(0o644)
+
+        load_config(str(config_file))
+
+        sidecar = tmp_path / "config.yaml.jsoncache"
+        assert sidecar.stat().st_mode & 0o777 == 0o600
+
     def test_load_config_file_not_found(self):
         """Test loading a non-existent config file."""
         with pytest.raises(FileNotFoundError):
@@ -102,6 +139,7 @@ class TestParseBBSEntry:
         assert result.port == 23
         assert result.description == ""
         assert result.auto_login is None
+        assert result.display_row == f"{'Test':<30} [telnet]"
 
     def test_parse_bbs_entry_full(self):
         """Test parsing full BBS entry."""
@@ -120,3 +158,12 @@ class TestParseBBSEntry:
         assert result.description == "A full test entry"
         assert result.auto_login is not None
         assert len(result.auto_login) == 1
+        assert result.auto_login[0] == AutoLoginStep(action="wait", value="ready")
+        assert result.auto_login is result.auto_login
+
+    def test_parse_bbs_entry_is_frozen(self):
+        """Test that parsed entries cannot be modified in place."""
+        result = _parse_bbs_entry({"name": "Test", "host": "example.com", "port": 23})
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.port = 2323
@@ -0,0 +1,35 @@
+"""Tests for main module helpers."""
+
+import pytest
+
+import main
+from main import _parse_baud_rate, _refresh_external_list
+from modem_forwarder.config import BBSEntry, GlobalConfig
+
+
+class TestParseBaudRate:
+    """Tests for _parse_baud_rate function."""
+
+    @pytest.mark.parametrize("connect_string, expected", [
+        ("CONNECT 2400", "2400"),
+        ("CONNECT 14400/ARQ", "14400"),
+        ("connect 9600", "9600"),
+        ("CONNECT", None),
+    ])
+    def test_parse_baud_rate(self, connect_string, expected):
+        """Test extracting the line rate from CONNECT strings."""
+        assert _parse_baud_rate(connect_string) == expected
+
+
+class TestRefreshExternalList:
+    """Tests for the background refresh of the external BBS list."""
+
+    def test_not_modified_keeps_current_list(self, mocker):
+        """Test that an unchanged download leaves the loaded list object in place."""
+        current = [BBSEntry(name="Test", host="localhost", port=23)]
+        mocker.patch("main._external_bbs_list", current)
+        mocker.patch("modem_forwarder.syncterm.download_syncterm_list", return_value=None)
+
+        _refresh_external_list(GlobalConfig())
+
+        assert main._external_bbs_list is current
@@ -3,7 +3,14 @@
 import pytest
 from unittest.mock import MagicMock, patch, call
 
-from modem_forwarder.menu import display_menu, get_selection
+from modem_forwarder.menu import (
+    _display_rows,
+    display_external_menu,
+    display_menu,
+    get_external_selection,
+    get_selection,
+    render_menu,
+)
 from modem_forwarder.terminal import TerminalType
 
 
@@ -19,8 +26,11 @@ class TestDisplayMenu:
             TerminalType.ASCII,
         )
 
-        # Should have written multiple times (welcome, header, entries, etc.)
-        assert mock_serial.write.call_count > 0
+        # Welcome, header, entries and footer all go out in one write
+        assert mock_serial.write.call_count == 1
+        output = mock_serial.write.call_args[0][0]
+        for bbs in sample_bbs_entries:
+            assert bbs.name.encode() in output
 
     def test_display_menu_shows_hangup_option(self, mock_serial, sample_bbs_entries):
         """Test that display_menu shows hang up option."""
@@ -36,6 +46,25 @@ class TestDisplayMenu:
         all_output = b"".join(c[0][0] for c in calls)
         assert b"Hang up" in all_output
 
+    def test_display_menu_single_write(self, mock_serial, sample_bbs_entries):
+        """Test that the whole menu is sent in one write."""
+        display_menu(
+            mock_serial,
+            sample_bbs_entries,
+            "Welcome!",
+            TerminalType.ANSI,
+        )
+
+        mock_serial.write.assert_called_once()
+        output = mock_serial.write.call_args[0][0]
+        assert b"\x1b[32m1. Test BBS 1\x1b[0m\r\n" in output
+
+    def test_render_menu_petscii_colors(self, sample_bbs_entries):
+        """Test that PETSCII menus carry raw color bytes and swapped case."""
+        output = render_menu(sample_bbs_entries, "Welcome!", TerminalType.PETSCII)
+
+        assert b"\x1e1. tEST bbs 1\r\n" in output
+
 
 class TestGetSelection:
     """Tests for menu selection."""
@@ -43,7 +72,6 @@ class TestGetSelection:
     def test_get_selection_valid_choice(self, mock_serial, sample_bbs_entries):
         """Test selecting a valid BBS."""
         mock_serial.in_waiting = 1
-        type(mock_serial).in_waiting = property(lambda self: 1)
         mock_serial.read.return_value = b"1"
 
         result = get_selection(
@@ -57,7 +85,6 @@ class TestGetSelection:
     def test_get_selection_second_entry(self, mock_serial, sample_bbs_entries):
         """Test selecting the second BBS."""
         mock_serial.in_waiting = 1
-        type(mock_serial).in_waiting = property(lambda self: 1)
         mock_serial.read.return_value = b"2"
 
         result = get_selection(
@@ -71,7 +98,6 @@ class TestGetSelection:
     def test_get_selection_hangup(self, mock_serial, sample_bbs_entries):
         """Test selecting hang up (0)."""
         mock_serial.in_waiting = 1
-        type(mock_serial).in_waiting = property(lambda self: 1)
         mock_serial.read.return_value = b"0"
 
         result = get_selection(
@@ -85,7 +111,6 @@ class TestGetSelection:
     def test_get_selection_invalid_then_valid(self, mock_serial, sample_bbs_entries):
         """Test invalid input followed by valid selection."""
         mock_serial.in_waiting = 1
-        type(mock_serial).in_waiting = property(lambda self: 1)
         # First return invalid, then valid
         mock_serial.read.side_effect = [b"x", b"1"]
 
@@ -96,3 +121,64 @@ class TestGetSelection:
         )
 
         assert result == sample_bbs_entries[0]
+
+    def test_get_selection_prompt_written_whole(self, mock_serial, sample_bbs_entries):
+        """Test that the colored choice prompt goes out in a single write."""
+        mock_serial.read.return_value = b"1"
+
+        get_selection(mock_serial, sample_bbs_entries, TerminalType.ANSI, has_external=True)
+
+        prompt = mock_serial.write.call_args_list[0][0][0]
+        assert prompt.startswith(b"\x1b[")
+        assert b"Enter choice (1-2, X for external, 0 to hang up): " in prompt
+
+
+class TestDisplayExternalMenu:
+    """Tests for the paginated external BBS menu."""
+
+    def test_external_page_single_write(self, mock_serial, sample_bbs_entries):
+        """Test that each page is sent in one write before the prompt."""
+        mock_serial.read.return_value = b"0"
+
+        result = display_external_menu(
+            mock_serial,
+            sample_bbs_entries,
+            TerminalType.ASCII,
+        )
+
+        assert result is None
+        page = mock_serial.write.call_args_list[0][0][0]
+        assert b"=== External BBSes (Page 1/1) ===" in page
+        assert b" 2. Test BBS 2" in page
+        assert b"[S]earch  [0] Back" in page
+
+    def test_rows_reused_for_same_list(self, sample_bbs_entries):
+        """Test that menu rows are built once per external list."""
+        rows = _display_rows(sample_bbs_entries)
+
+        assert rows == tuple(bbs.display_row for bbs in sample_bbs_entries)
+        assert _display_rows(sample_bbs_entries) is rows
+
+
+class TestGetExternalSelection:
+    """Tests for single-key parsing on an external BBS page."""
+
+    def test_lowercase_navigation_key(self, mock_serial, sample_bbs_entries):
+        """Test that navigation letters are accepted in either case."""
+        mock_serial.read.return_value = b"n"
+
+        result = get_external_selection(
+            mock_serial, sample_bbs_entries, TerminalType.ASCII, has_next=True
+        )
+
+        assert result == "next"
+
+    def test_unavailable_navigation_then_digit(self, mock_serial, sample_bbs_entries):
+        """Test that a disabled nav key is ignored and a digit selects."""
+        mock_serial.read.side_effect = [b"P", b"9", b"2"]
+
+        result = get_external_selection(
+            mock_serial, sample_bbs_entries, TerminalType.ASCII
+        )
+
+        assert result == sample_bbs_entries[1]
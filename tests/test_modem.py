@@ -0,0 +1,234 @@
+"""Tests for modem module."""
+
+import logging
+import os
+import time
+from unittest.mock import PropertyMock
+
+from modem_forwarder.modem import (
+    flush_input_buffer,
+    force_hangup,
+    init_modem,
+    modem_getch,
+    modem_input,
+    modem_print_lines,
+    take_typeahead,
+    wait_for_connect,
+    wait_modem_idle,
+)
+
+
+def _feed(mock_serial, chunks):
+    """Make mock_serial deliver the given byte chunks, one per read."""
+    pending = list(chunks)
+    type(mock_serial).in_waiting = PropertyMock(
+        side_effect=lambda: len(pending[0]) if pending else 0
+    )
+    mock_serial.read.side_effect = lambda n=1: pending.pop(0) if pending else b""
+
+
+class TestWaitForConnect:
+    """Tests for incoming call detection."""
+
+    def test_wait_for_connect_returns_connect_line(self, mock_serial):
+        """Test that the full CONNECT line is returned."""
+        _feed(mock_serial, [b"\r\nRING\r\n", b"\r\nCONNECT 2400/ARQ\r\n"])
+
+        result = wait_for_connect(mock_serial)
+
+        assert result == "CONNECT 2400/ARQ"
+
+    def test_wait_for_connect_split_line(self, mock_serial):
+        """Test a CONNECT line split across reads is returned whole."""
+        _feed(mock_serial, [b"\r\nCONN", b"ECT 96", b"00/V42\r\n"])
+
+        result = wait_for_connect(mock_serial)
+
+        assert result == "CONNECT 9600/V42"
+
+    def test_wait_for_connect_caps_unterminated_line(self, mock_serial, mocker):
+        """Test that a CONNECT line with no end is cut off rather than buffered on."""
+        mocker.patch("modem_forwarder.modem.time.sleep")
+        _feed(mock_serial, [b"CONNECT 2400" + b"X" * 500])
+
+        result = wait_for_connect(mock_serial)
+
+        assert result.startswith("CONNECT 2400X")
+        assert len(result) == 128
+
+    def test_wait_for_connect_flushes_once(self, mock_serial, mocker):
+        """Test that input after CONNECT is discarded with one reset, not read back."""
+        mocker.patch("modem_forwarder.modem.time.sleep")
+        _feed(mock_serial, [b"CONNECT 2400\r\n"])
+
+        wait_for_connect(mock_serial)
+
+        mock_serial.reset_input_buffer.assert_called_once()
+        assert mock_serial.read.call_count == 1
+
+
+class TestWaitModemIdle:
+    """Tests for waiting out carrier after a hangup."""
+
+    def test_returns_when_carrier_drops(self, mock_serial):
+        """Test that a dropped carrier returns straight away."""
+        mock_serial.cd = False
+
+        assert wait_modem_idle(mock_serial, timeout=1.0) is True
+
+    def test_forced_dcd_times_out_quietly(self, mock_serial, mocker, caplog):
+        """Test that DCD held high (AT&C0) does not log a warning every session."""
+        mocker.patch("modem_forwarder.modem.time.sleep")
+        mock_serial.cd = True
+
+        assert wait_modem_idle(mock_serial, timeout=0.01) is False
+        assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
+
+
+class TestModemInput:
+    """Tests for line input."""
+
+    def test_modem_input_handles_typed_ahead_chunk(self, mock_serial):
+        """Test that a burst of keystrokes is edited and echoed in one write."""
+        _feed(mock_serial, [b"ab\x7fc\r"])
+
+        result = modem_input(mock_serial)
+
+        assert result == "ac"
+        mock_serial.write.assert_called_once_with(b"ab\x08 \x08c\r\n")
+
+    def test_modem_input_masks_echo(self, mock_serial):
+        """Test that mask_char replaces echoed characters."""
+        _feed(mock_serial, [b"\r\nse", b"cret\r"])
+
+        result = modem_input(mock_serial, mask_char="*")
+
+        assert result == "secret"
+        written = b"".join(c[0][0] for c in mock_serial.write.call_args_list)
+        assert written == b"******\r\n"
+
+    def test_modem_input_keeps_bytes_after_enter(self, mock_serial):
+        """Test that keys typed after Enter are left for the next read."""
+        _feed(mock_serial, [b"ab\r\n1"])
+
+        assert modem_input(mock_serial, echo=False) == "ab"
+        assert modem_getch(mock_serial) == b"1"
+        assert take_typeahead(mock_serial) == b""
+
+
+class TestModemGetch:
+    """Tests for single-character reads."""
+
+    def test_modem_getch_blocks_on_read(self, mock_serial, mocker):
+        """Test that getch relies on the read timeout rather than sleeping."""
+        mock_serial.timeout = 0.1
+        mock_serial.read.side_effect = [b"", b"", b"x"]
+        sleep = mocker.patch("modem_forwarder.modem.time.sleep")
+
+        result = modem_getch(mock_serial)
+
+        assert result == b"x"
+        sleep.assert_not_called()
+
+    def test_modem_getch_nonblocking_port_sleeps(self, mock_serial, mocker):
+        """Test that a timeout=0 port sleeps between empty reads."""
+        mock_serial.timeout = 0
+        mock_serial.read.side_effect = [b"", b"x"]
+        sleep = mocker.patch("modem_forwarder.modem.time.sleep")
+
+        result = modem_getch(mock_serial)
+
+        assert result == b"x"
+        sleep.assert_called_once()
+
+    def test_nonblocking_port_waits_on_fd(self, mock_serial, mocker):
+        """Test that a timeout=0 port with a real fd waits in select, not sleep."""
+        read_fd, write_fd = os.pipe()
+        try:
+            mock_serial.timeout = 0
+            mock_serial.fileno.return_value = read_fd
+            mock_serial.read.side_effect = [b"", b"x"]
+            os.write(write_fd, b"x")
+            sleep = mocker.patch("modem_forwarder.modem.time.sleep")
+
+            result = modem_getch(mock_serial)
+
+            assert result == b"x"
+            sleep.assert_not_called()
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_buffered_getch_reads_burst_once(self, mock_serial):
+        """Test that queued keys are served from one read, in order."""
+        _feed(mock_serial, [b"12"])
+
+        assert modem_getch(mock_serial) == b"1"
+        assert modem_getch(mock_serial) == b"2"
+        mock_serial.read.assert_called_once_with(2)
+
+    def test_typeahead_reaches_later_readers(self, mock_serial):
+        """Test that keys read ahead are handed to the next reader, then cleared by a flush."""
+        _feed(mock_serial, [b"1ab\r"])
+
+        modem_getch(mock_serial)
+        assert modem_input(mock_serial, echo=False) == "ab"
+
+        _feed(mock_serial, [b"234"])
+        modem_getch(mock_serial)
+        flush_input_buffer(mock_serial)
+        assert take_typeahead(mock_serial) == b""
+
+
+class TestModemPrintLines:
+    """Tests for multi-line output."""
+
+    def test_lines_sent_in_one_write(self, mock_serial):
+        """Test that all lines go out CRLF-terminated in a single write and flush."""
+        modem_print_lines(mock_serial, "", "Hello", "")
+
+        mock_serial.write.assert_called_once_with(b"\r\nHello\r\n\r\n")
+        mock_serial.flush.assert_called_once()
+
+
+class TestForceHangup:
+    """Tests for forced hangup."""
+
+    def test_escape_skipped_when_dtr_drops_carrier(self, mock_serial, mocker):
+        """Test that +++ and its guard times are skipped once carrier is gone."""
+        mocker.patch("modem_forwarder.modem.time.sleep")
+        mock_serial.is_local = False
+        mock_serial.cd = False
+        _feed(mock_serial, [b"\r\nOK\r\n"])
+
+        force_hangup(mock_serial)
+
+        written = [c[0][0] for c in mock_serial.write.call_args_list]
+        assert written == [b"ATH\r"]
+
+    def test_escape_sent_while_carrier_up(self, mock_serial, mocker):
+        """Test that +++ is sent when carrier is still up after the DTR drop."""
+        mocker.patch("modem_forwarder.modem.time.sleep")
+        mock_serial.is_local = False
+        mock_serial.cd = True
+        _feed(mock_serial, [b"\r\nOK\r\n"])
+
+        force_hangup(mock_serial)
+
+        written = [c[0][0] for c in mock_serial.write.call_args_list]
+        assert written == [b"+++", b"ATH\r"]
+
+
+class TestInitModem:
+    """Tests for modem initialization."""
+
+    def test_init_modem_moves_on_at_ok(self, mock_serial):
+        """Test that each command proceeds as soon as OK arrives."""
+        _feed(mock_serial, [b"ATZ\r\r\nOK\r\n", b"\r\nOK\r\n"])
+
+        start = time.time()
+        init_modem(mock_serial, init_sequence=["ATZ", "ATE0"])
+
+        written = [c[0][0] for c in mock_serial.write.call_args_list]
+        assert written == [b"ATZ\r", b"ATE0\r"]
+        assert time.time() - start < 1.0
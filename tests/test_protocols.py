@@ -0,0 +1,99 @@
+"""Tests for protocols module."""
+
+import socket
+import threading
+
+import pytest
+
+from modem_forwarder.config import BBSEntry
+from modem_forwarder import protocols
+from modem_forwarder.protocols import _interleave_families, _open_tcp, _resolve, create_rlogin_connection
+
+
+class TestOpenTcp:
+    """Tests for the racing TCP connect."""
+
+    def test_open_tcp_connects(self):
+        """Test connecting to a listening socket sets TCP_NODELAY and the timeout."""
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        try:
+            sock = _open_tcp("127.0.0.1", server.getsockname()[1], timeout=2)
+            try:
+                assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+                assert sock.gettimeout() == 2
+            finally:
+                sock.close()
+        finally:
+            server.close()
+
+    def test_open_tcp_refused(self):
+        """Test that a refused connection raises OSError."""
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        port = server.getsockname()[1]
+        server.close()
+
+        with pytest.raises(OSError):
+            _open_tcp("127.0.0.1", port, timeout=2)
+
+    def test_resolve_reuses_answer(self, mocker):
+        """Test that a second lookup of the same host:port skips DNS."""
+        mocker.patch.dict(protocols._addr_cache, clear=True)
+        getaddrinfo = mocker.patch("socket.getaddrinfo", return_value=["addr"])
+
+        assert _resolve("bbs.example.com", 23) == ["addr"]
+        assert _resolve("bbs.example.com", 23) == ["addr"]
+        getaddrinfo.assert_called_once()
+
+    def test_failed_connect_drops_cached_answer(self, mocker):
+        """Test that a refused connection forgets the resolved addresses."""
+        mocker.patch.dict(protocols._addr_cache, clear=True)
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        port = server.getsockname()[1]
+        server.close()
+
+        with pytest.raises(OSError):
+            _open_tcp("127.0.0.1", port, timeout=2)
+
+        assert ("127.0.0.1", port) not in protocols._addr_cache
+
+    def test_interleave_families(self):
+        """Test that address families alternate, starting with the first result."""
+        v6a, v6b = (socket.AF_INET6, 1), (socket.AF_INET6, 2)
+        v4a = (socket.AF_INET, 3)
+
+        assert _interleave_families([v6a, v6b, v4a]) == [v6a, v4a, v6b]
+
+
+class TestRloginConnection:
+    """Tests for the rlogin handshake."""
+
+    def test_handshake_sent_in_one_packet(self, mock_serial):
+        """Test that the RFC 1282 handshake arrives whole and the ack is consumed."""
+        mock_serial.read.return_value = b"bob\r"
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        received = []
+
+        def serve():
+            conn, _ = server.accept()
+            received.append(conn.recv(64))
+            conn.sendall(b"\x00")
+            conn.close()
+
+        thread = threading.Thread(target=serve)
+        thread.start()
+        try:
+            bbs = BBSEntry(name="R", host="127.0.0.1", port=server.getsockname()[1], protocol="rlogin")
+            sock = create_rlogin_connection(bbs, mock_serial, timeout=2)
+            thread.join(2)
+            assert sock is not None
+            sock.close()
+        finally:
+            server.close()
+
+        assert received == [b"\x00bob\x00bob\x00ansi/9600\x00"]
@@ -0,0 +1,143 @@
+"""Tests for syncterm module."""
+
+import json
+import urllib.error
+from unittest.mock import MagicMock
+
+import pytest
+
+from modem_forwarder.config import BBSEntry
+from modem_forwarder.syncterm import download_syncterm_list, parse_syncterm_lst, search_bbs_list
+
+
+@pytest.fixture
+def external_bbs():
+    """Small external BBS list for search tests."""
+    return [
+        BBSEntry(name="Particles", host="particlesbbs.dyndns.org", port=6400, description="C64 BBS"),
+        BBSEntry(name="Level 29", host="bbs.fozztexx.com", port=23, description="Retro computing"),
+    ]
+
+
+class TestParseSynctermLst:
+    """Tests for syncterm.lst parsing."""
+
+    def test_parse_sections_and_fields(self):
+        """Test CRLF lines, comments, defaults and multi-line comments."""
+        content = (
+            b"; SyncTERM dialing directory\r\n"
+            b"[Particles] \r\n"
+            b"\tConnectionType=Telnet\r\n"
+            b"\tAddress=particlesbbs.dyndns.org\r\n"
+            b"\tPort=6400\r\n"
+            b"\tComment=C64 BBS\r\n"
+            b"\tstill the comment\r\n"
+            b"[Secure]\r\n"
+            b"\tConnectionType=SSH\r\n"
+            b"\tAddress=ssh.example.com\r\n"
+            b"\tPort=not-a-port\r\n"
+            b"[No Address]\r\n"
+            b"\tPort=23\r\n"
+        )
+
+        entries = parse_syncterm_lst(content)
+
+        assert [bbs.name for bbs in entries] == ["Particles", "Secure"]
+        assert entries[0].host == "particlesbbs.dyndns.org"
+        assert entries[0].port == 6400
+        assert entries[0].protocol == "telnet"
+        assert entries[0].description == "C64 BBS still the comment"
+        assert entries[1].protocol == "ssh"
+        assert entries[1].port == 22
+
+    def test_parse_decodes_only_field_values(self):
+        """Test that UTF-8 names are decoded and invalid bytes are replaced."""
+        content = b"[Caf\xc3\xa9 BBS]\n\tAddress=cafe.example.com\n\tComment=bad \xff\n"
+
+        entries = parse_syncterm_lst(content)
+
+        assert entries[0].name == "Caf\u00e9 BBS"
+        assert entries[0].description == "bad \ufffd"
+
+
+SAMPLE_LST = b"[Particles]\n\tAddress=particlesbbs.dyndns.org\n\tPort=6400\n"
+
+
+class TestDownloadSynctermList:
+    """Tests for the conditional download of syncterm.lst."""
+
+    def test_download_saves_validators(self, tmp_path, mocker):
+        """Test that a fresh download caches the body and its ETag."""
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.read.return_value = SAMPLE_LST
+        response.headers = {"ETag": '"abc"', "Last-Modified": "Sat, 01 Aug 2026 00:00:00 GMT"}
+        urlopen = mocker.patch("urllib.request.urlopen", return_value=response)
+        cache = tmp_path / "syncterm.lst"
+
+        entries = download_syncterm_list("http://example.com/syncterm.lst", str(cache))
+
+        assert [bbs.name for bbs in entries] == ["Particles"]
+        assert cache.read_bytes() == SAMPLE_LST
+        assert json.loads((tmp_path / "syncterm.lst.etag").read_text())["etag"] == '"abc"'
+        assert urlopen.call_args[0][0].get_header("If-none-match") is None
+
+    def test_not_modified_keeps_current_list(self, tmp_path, mocker):
+        """Test that a 304 reply neither re-reads nor re-parses the cache."""
+        cache = tmp_path / "syncterm.lst"
+        cache.write_bytes(SAMPLE_LST)
+        (tmp_path / "syncterm.lst.etag").write_text(json.dumps({"etag": '"abc"'}))
+        not_modified = urllib.error.HTTPError("http://example.com", 304, "Not Modified", {}, None)
+        urlopen = mocker.patch("urllib.request.urlopen", side_effect=not_modified)
+        parse = mocker.patch("modem_forwarder.syncterm.parse_syncterm_lst")
+
+        entries = download_syncterm_list("http://example.com/syncterm.lst", str(cache))
+
+        assert entries is None
+        parse.assert_not_called()
+        assert urlopen.call_args[0][0].get_header("If-none-match") == '"abc"'
+
+    def test_not_modified_refreshes_validators(self, tmp_path, mocker):
+        """Test that validators sent with a 304 reply replace the stored ones."""
+        cache = tmp_path / "syncterm.lst"
+        cache.write_bytes(SAMPLE_LST)
+        etag_file = tmp_path / "syncterm.lst.etag"
+        etag_file.write_text(json.dumps({"etag": '"abc"', "last_modified": "Sat, 01 Aug 2026 00:00:00 GMT"}))
+        not_modified = urllib.error.HTTPError("http://example.com", 304, "Not Modified", {"ETag": '"def"'}, None)
+        mocker.patch("urllib.request.urlopen", side_effect=not_modified)
+
+        download_syncterm_list("http://example.com/syncterm.lst", str(cache))
+
+        assert json.loads(etag_file.read_text()) == {
+            "etag": '"def"',
+            "last_modified": "Sat, 01 Aug 2026 00:00:00 GMT",
+        }
+
+
+class TestSearchBBSList:
+    """Tests for external list search."""
+
+    def test_search_matches_name_and_description(self, external_bbs):
+        """Test case-insensitive matching on name and description."""
+        assert search_bbs_list(external_bbs, "PARTICLES") == [external_bbs[0]]
+        assert search_bbs_list(external_bbs, "retro") == [external_bbs[1]]
+
+    def test_search_repeated_query_is_cached(self, external_bbs):
+        """Test that repeating a query on the same list reuses the result."""
+        first = search_bbs_list(external_bbs, "bbs")
+
+        assert search_bbs_list(external_bbs, "BBS") is first
+
+    def test_search_new_list_invalidates_cache(self, external_bbs):
+        """Test that searching a refreshed list doesn't return stale results."""
+        search_bbs_list(external_bbs, "bbs")
+        refreshed = external_bbs[:1]
+
+        assert search_bbs_list(refreshed, "bbs") == [external_bbs[0]]
+
+    def test_search_does_not_match_across_fields(self):
+        """Test that a query spanning the end of the name and start of the description misses."""
+        entry = BBSEntry(name="Level", host="example.com", port=23, description="Twenty Nine")
+
+        assert search_bbs_list([entry], "eltw") == []
+        assert search_bbs_list([entry], "LEVEL") == [entry]
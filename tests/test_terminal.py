@@ -1,7 +1,11 @@
 """Tests for terminal detection module."""
 
+import os
+import time
+from itertools import chain, repeat
+
 import pytest
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import MagicMock, PropertyMock, patch, call
 
 from modem_forwarder.terminal import (
     TerminalType,
@@ -10,6 +14,11 @@ from modem_forwarder.terminal import (
     get_terminal_type,
     safe_print,
     ascii_to_petscii,
+    ascii_to_petscii_bytes,
+    colorize,
+    get_color_code,
+    render_line,
+    Color,
     ANSI_CURSOR_POSITION_REQUEST,
 )
 
@@ -19,73 +28,138 @@ class TestDetectTerminal:
 
     def test_detect_ansi_terminal(self, mock_serial):
         """Test detecting ANSI terminal from cursor position response."""
-        # Simulate ANSI response to cursor position request
-        mock_serial.in_waiting = 0
-        responses = [b"\x1b[24;80R"]  # ESC [ row ; col R
-        call_count = [0]
-
-        def mock_in_waiting():
-            if call_count[0] < 5:
-                call_count[0] += 1
-                return 0
-            return len(responses[0]) if responses else 0
+        # Nothing waiting for the first few polls, then the whole reply
+        reply = b"\x1b[24;80R"  # ESC [ row ; col R
+        type(mock_serial).in_waiting = PropertyMock(side_effect=chain([0] * 5, repeat(len(reply))))
+        mock_serial.read.side_effect = [reply]
 
-        def mock_read(n):
-            if responses:
-                return responses.pop(0)
-            return b""
-
-        mock_serial.in_waiting = property(lambda self: mock_in_waiting())
-        type(mock_serial).in_waiting = property(lambda self: mock_in_waiting())
-        mock_serial.read.side_effect = mock_read
-
-        result = detect_terminal(mock_serial, timeout=0.2)
+        result = detect_terminal(mock_serial, timeout=1.0)
 
         # Should have sent cursor position request
         mock_serial.write.assert_called_with(ANSI_CURSOR_POSITION_REQUEST)
+        assert result == TerminalType.ANSI
+        assert mock_serial.read.call_args == call(len(reply))
 
     def test_detect_no_response(self, mock_serial):
         """Test detection with no response."""
         mock_serial.in_waiting = 0
-        type(mock_serial).in_waiting = property(lambda self: 0)
 
         result = detect_terminal(mock_serial, timeout=0.1)
 
         assert result is None
 
+    def test_detect_leaves_port_timeout_alone(self, mock_serial):
+        """Test that a port with no read timeout is bounded by the deadline without reconfiguring it."""
+        port_timeout = PropertyMock(return_value=None)
+        type(mock_serial).timeout = port_timeout
+        start = time.monotonic()
+
+        result = detect_terminal(mock_serial, timeout=0.05)
+
+        assert result is None
+        assert time.monotonic() - start < 1.0
+        mock_serial.read.assert_not_called()
+        assert not [c for c in port_timeout.call_args_list if c.args]
+
+    def test_detect_waits_on_port_fd(self, mock_serial):
+        """Test that detection waits on the port's fd rather than sleeping between polls."""
+        read_fd, write_fd = os.pipe()
+        try:
+            mock_serial.fileno.return_value = read_fd
+            mock_serial.read.return_value = b"\x1b[24;80R"
+            os.write(write_fd, b"\x1b[24;80R")
+
+            with patch("modem_forwarder.modem.time.sleep") as sleep:
+                result = detect_terminal(mock_serial, timeout=1.0)
+
+            assert result == TerminalType.ANSI
+            sleep.assert_not_called()
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_detect_reads_waiting_reply_in_one_call(self, mock_serial):
+        """Test that a reply already waiting on the port is taken in one read."""
+        reply = b"\x1b[24;80R"
+        mock_serial.in_waiting = len(reply)
+        mock_serial.read.side_effect = [reply]
+
+        result = detect_terminal(mock_serial, timeout=1.0)
+
+        assert result == TerminalType.ANSI
+        assert mock_serial.read.call_args_list == [call(len(reply))]
+
+    def test_detect_reply_split_across_reads(self, mock_serial):
+        """Test that a cursor position report split across reads is detected."""
+        mock_serial.in_waiting = 1
+        mock_serial.read.side_effect = [b"\x1b[2", b"4;8", b"0R"]
+
+        result = detect_terminal(mock_serial, timeout=1.0)
+
+        assert result == TerminalType.ANSI
+
+    def test_detect_ignores_stray_bytes(self, mock_serial):
+        """Test that unrelated ESC [ and R bytes are not taken as a reply."""
+        mock_serial.in_waiting = 1
+        mock_serial.read.side_effect = lambda n: b"\x1b[2J READY"
+
+        result = detect_terminal(mock_serial, timeout=0.05)
+
+        assert result is None
+
 
 class TestPromptTerminalType:
     """Tests for terminal type prompting."""
 
-    def test_prompt_petscii(self, mock_serial):
-        """Test selecting PETSCII terminal."""
+    @pytest.mark.parametrize("key, expected", [
+        (b"1", TerminalType.PETSCII),
+        (b"2", TerminalType.ANSI),
+        (b"3", TerminalType.ASCII),
+    ])
+    def test_prompt_selection(self, mock_serial, key, expected):
+        """Test that each menu key selects its terminal type."""
         mock_serial.in_waiting = 1
-        type(mock_serial).in_waiting = property(lambda self: 1)
-        mock_serial.read.return_value = b"1"
+        mock_serial.read.return_value = key
 
         result = prompt_terminal_type(mock_serial)
 
-        assert result == TerminalType.PETSCII
+        assert result == expected
 
-    def test_prompt_ansi(self, mock_serial):
-        """Test selecting ANSI terminal."""
+    def test_prompt_menu_and_prompt_single_write(self, mock_serial):
+        """Test that the menu and choice prompt go out in one write."""
         mock_serial.in_waiting = 1
-        type(mock_serial).in_waiting = property(lambda self: 1)
         mock_serial.read.return_value = b"2"
 
-        result = prompt_terminal_type(mock_serial)
+        prompt_terminal_type(mock_serial)
 
-        assert result == TerminalType.ANSI
+        assert mock_serial.write.call_count == 1
+        data = mock_serial.write.call_args[0][0]
+        assert data.startswith(b"\r\nSelect your terminal type:\r\n")
+        assert data.endswith(b"Enter choice (1-3): \r\n")
 
-    def test_prompt_ascii(self, mock_serial):
-        """Test selecting ASCII terminal."""
+    def test_prompt_retry_repeats_prompt(self, mock_serial):
+        """Test that a bad key sends the error and prompt together."""
         mock_serial.in_waiting = 1
-        type(mock_serial).in_waiting = property(lambda self: 1)
-        mock_serial.read.return_value = b"3"
+        mock_serial.read.side_effect = [b"x", b"3"]
 
         result = prompt_terminal_type(mock_serial)
 
         assert result == TerminalType.ASCII
+        assert mock_serial.write.call_count == 2
+        assert mock_serial.write.call_args[0][0] == (
+            b"Invalid input. Please enter 1-3.\r\nEnter choice (1-3): \r\n"
+        )
+
+    def test_prompt_out_of_range_digit(self, mock_serial):
+        """Test that a digit outside 1-3 asks again."""
+        mock_serial.in_waiting = 1
+        mock_serial.read.side_effect = [b"7", b"1"]
+
+        result = prompt_terminal_type(mock_serial)
+
+        assert result == TerminalType.PETSCII
+        assert mock_serial.write.call_args[0][0].startswith(b"Please enter 1, 2, or 3.\r\n")
+
 
 class TestGetTerminalType:
     """Tests for get_terminal_type function."""
@@ -137,6 +211,25 @@ class TestAsciiToPetscii:
         """Test mixed content."""
         assert ascii_to_petscii("BBS Menu 1.") == "bbs mENU 1."
 
+    def test_ascii_to_petscii_bytes_matches_str(self):
+        """Test that the byte table gives the same result as swapcase."""
+        text = "BBS Menu 1. [Q]uit\r\n"
+        assert ascii_to_petscii_bytes(text.encode()) == ascii_to_petscii(text).encode()
+
+
+class TestGetColorCode:
+    """Tests for get_color_code function."""
+
+    def test_ansi_family_codes(self):
+        """Test that ANSI and VT100 share the ANSI SGR codes."""
+        assert get_color_code(Color.RED, TerminalType.ANSI) == "\x1b[31m"
+        assert get_color_code(Color.RED, TerminalType.VT100) == "\x1b[31m"
+
+    def test_no_string_codes_for_ascii_or_petscii(self):
+        """Test that ASCII and PETSCII get no string color codes."""
+        assert get_color_code(Color.RED, TerminalType.ASCII) == ""
+        assert get_color_code(Color.RED, TerminalType.PETSCII) == ""
+
 
 class TestSafePrint:
     """Tests for safe_print function."""
@@ -145,23 +238,46 @@ class TestSafePrint:
         """Test that safe_print sends text with CRLF."""
         safe_print(mock_serial, "Hello", TerminalType.ASCII)
 
-        mock_serial.write.assert_called()
-        call_args = mock_serial.write.call_args[0][0]
-        assert call_args.endswith(b"\r\n")
+        mock_serial.write.assert_called_once_with(b"Hello\r\n")
 
     def test_safe_print_petscii_swaps_case(self, mock_serial):
         """Test that PETSCII output has case swapped."""
         safe_print(mock_serial, "Hello", TerminalType.PETSCII)
 
-        mock_serial.write.assert_called()
-        call_args = mock_serial.write.call_args[0][0]
-        # Should be "hELLO" with CRLF
-        assert b"hELLO" in call_args
+        mock_serial.write.assert_called_once_with(b"hELLO\r\n")
 
     def test_safe_print_ascii_no_swap(self, mock_serial):
         """Test that ASCII output is unchanged."""
-        safe_print(mock_serial, "Hello", TerminalType.ASCII)
+        safe_print(mock_serial, "Hello World", TerminalType.ASCII)
+
+        mock_serial.write.assert_called_once_with(b"Hello World\r\n")
+
+    def test_safe_print_single_write(self, mock_serial):
+        """Test that text and CRLF go out in one write and flush."""
+        safe_print(mock_serial, "Hello", TerminalType.PETSCII)
+
+        mock_serial.write.assert_called_once_with(b"hELLO\r\n")
+        mock_serial.flush.assert_called_once()
+
+
+class TestRenderLine:
+    """Tests for render_line function."""
+
+    def test_render_line_ansi_matches_colorize(self):
+        """Test that pre-encoded ANSI output equals the string colorization."""
+        expected = (colorize("Hello", Color.GREEN, TerminalType.ANSI) + "\r\n").encode()
+
+        assert render_line("Hello", TerminalType.ANSI, Color.GREEN) == expected
+
+    def test_render_line_ascii_ignores_color(self):
+        """Test that ASCII lines carry no color codes."""
+        assert render_line("Hello", TerminalType.ASCII, Color.GREEN) == b"Hello\r\n"
+
+    def test_colorize_bytes_matches_str(self):
+        """Test that colorizing bytes gives the encoded str result."""
+        expected = colorize("Hello", Color.RED, TerminalType.VT100).encode()
+        assert colorize(b"Hello", Color.RED, TerminalType.VT100) == expected
 
-        mock_serial.write.assert_called()
-        call_args = mock_serial.write.call_args[0][0]
-        assert b"Hello" in call_args
+    def test_render_line_petscii_color_byte(self):
+        """Test that PETSCII lines start with the raw color byte."""
+        assert render_line("Hello", TerminalType.PETSCII, Color.CYAN) == b"\x9fhELLO\r\n"